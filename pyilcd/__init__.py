@@ -3,6 +3,7 @@
 from .config import Defaults
 from .contact_dataset import ContactDataSet
 from .core import (
+    find_duplicate_datasets,
     parse_directory_contact_dataset,
     parse_directory_flow_dataset,
     parse_directory_flow_property_dataset,
@@ -15,12 +16,20 @@ from .core import (
     parse_file_process_dataset,
     parse_file_source_dataset,
     parse_file_unit_group_dataset,
+    parse_stream_contact_dataset,
+    parse_stream_exchanges,
+    parse_stream_flow_dataset,
+    parse_stream_flow_property_dataset,
+    parse_stream_process_dataset,
+    parse_stream_source_dataset,
+    parse_stream_unit_group_dataset,
     parse_zip_file_contact_dataset,
     parse_zip_file_flow_dataset,
     parse_zip_file_flow_property_dataset,
     parse_zip_file_process_dataset,
     parse_zip_file_source_dataset,
     parse_zip_file_unit_group_dataset,
+    resolve_global_reference,
     save_ilcd_file,
     validate_directory_contact_dataset,
     validate_directory_flow_dataset,
@@ -53,6 +62,7 @@ __all__ = (
     "__version__",
     "ContactDataSet",
     "Defaults",
+    "find_duplicate_datasets",
     "FlowDataSet",
     "FlowPropertyDataSet",
     "parse_directory_contact_dataset",
@@ -67,6 +77,13 @@ __all__ = (
     "parse_file_process_dataset",
     "parse_file_source_dataset",
     "parse_file_unit_group_dataset",
+    "parse_stream_contact_dataset",
+    "parse_stream_exchanges",
+    "parse_stream_flow_dataset",
+    "parse_stream_flow_property_dataset",
+    "parse_stream_process_dataset",
+    "parse_stream_source_dataset",
+    "parse_stream_unit_group_dataset",
     "parse_zip_file_contact_dataset",
     "parse_zip_file_flow_dataset",
     "parse_zip_file_flow_property_dataset",
@@ -74,6 +91,7 @@ __all__ = (
     "parse_zip_file_source_dataset",
     "parse_zip_file_unit_group_dataset",
     "ProcessDataSet",
+    "resolve_global_reference",
     "save_ilcd_file",
     "SourceDataSet",
     "validate_file_contact_dataset",
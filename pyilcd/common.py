@@ -4,12 +4,18 @@ from datetime import datetime
 from typing import List
 
 from lxml import etree
-from lxmlh import get_element, get_element_list
 
 from .helpers import (
+    NAMESPACE_FLOW_DATASET,
+    NAMESPACE_FLOW_PROPERTY_DATASET,
+    NAMESPACE_UNIT_GROUP_DATASET,
+    ChildElementList,
     create_attribute_list_process_dataset,
     create_attribute_process_dataset,
+    create_element_common,
+    create_element_list_common,
     create_element_text_process_dataset,
+    get_tag,
 )
 
 
@@ -46,11 +52,11 @@ class ClassificationInformation(etree.ElementBase):
     nevertheless be avoided to use identical names for Processes in the same
     category."""
 
-    @property
-    def classifications(self) -> List["Classification"]:
-        """Optional statistical or other classification of the data set.
-        Typically also used for structuring LCA databases."""
-        return get_element_list(self, "common:classification")
+    classifications: List["Classification"] = create_element_list_common(
+        "classification"
+    )
+    """Optional statistical or other classification of the data set.
+    Typically also used for structuring LCA databases."""
 
 
 class Classification(etree.ElementBase):
@@ -68,10 +74,8 @@ class Classification(etree.ElementBase):
     correspond to the classes defined in the classification
     file.]"""
 
-    @property
-    def classesList(self) -> List["Class"]:
-        """Name of the class."""
-        return get_element_list(self, "common:class")
+    classesList: List["Class"] = create_element_list_common("class")
+    """Name of the class."""
 
 
 class Class(etree.ElementBase):
@@ -98,10 +102,8 @@ class Scope(etree.ElementBase):
     name = create_attribute_process_dataset("name", str)
     """Scope name"""
 
-    @property
-    def method(self) -> List["Method"]:
-        """Validation method(s) used in the respective "Scope of review"."""
-        return get_element_list(self, "common:method")
+    method: List["Method"] = create_element_list_common("method")
+    """Validation method(s) used in the respective "Scope of review"."""
 
 
 class Method(etree.ElementBase):
@@ -117,13 +119,13 @@ class DataQualityIndicators(etree.ElementBase):
     (and hence searchable) form. This serves to support LCA practitioners
     to identify/select the highest quality and most appropriate data sets."""
 
-    @property
-    def dataQualityIndicators(self) -> List["DataQualityIndicator"]:
-        """Data quality indicators serve to provide the reviewed key
-        information on the data set in a defined, computer-readable
-        (and hence searchable) form. This serves to support LCA practitioners
-        to identify/select the highest quality and most appropriate data sets."""
-        return get_element_list(self, "common:dataQualityIndicator")
+    dataQualityIndicators: List["DataQualityIndicator"] = create_element_list_common(
+        "dataQualityIndicator"
+    )
+    """Data quality indicators serve to provide the reviewed key
+    information on the data set in a defined, computer-readable
+    (and hence searchable) form. This serves to support LCA practitioners
+    to identify/select the highest quality and most appropriate data sets."""
 
 
 class DataQualityIndicator(etree.ElementBase):
@@ -158,22 +160,20 @@ class ValidationGroup1(etree.ElementBase):
     should be addressed by the reviewer. An overall quality statement on the
     data set may be included here."""
 
-    @property
-    def scope(self) -> "Scope":
-        """Scope of review regarding which aspects and components
-        of the data set was reviewed or verified. In case of
-        aggregated e.g. LCI results also and on which level of
-        detail (e.g. LCI results only, included unit processes, ...)
-        the review / verification was performed."""
-        return get_element(self, "common:scope")
+    scope: "Scope" = create_element_common("scope")
+    """Scope of review regarding which aspects and components
+    of the data set was reviewed or verified. In case of
+    aggregated e.g. LCI results also and on which level of
+    detail (e.g. LCI results only, included unit processes, ...)
+    the review / verification was performed."""
 
-    @property
-    def dataQualityIndicators(self) -> "DataQualityIndicators":
-        """Data quality indicators serve to provide the reviewed key
-        information on the data set in a defined, computer-readable
-        (and hence searchable) form. This serves to support LCA practitioners
-        to identify/select the highest quality and most appropriate data sets."""
-        return get_element(self, "common:dataQualityIndicators")
+    dataQualityIndicators: "DataQualityIndicators" = create_element_common(
+        "dataQualityIndicators"
+    )
+    """Data quality indicators serve to provide the reviewed key
+    information on the data set in a defined, computer-readable
+    (and hence searchable) form. This serves to support LCA practitioners
+    to identify/select the highest quality and most appropriate data sets."""
 
 
 class ValidationGroup3(etree.ElementBase):
@@ -186,17 +186,17 @@ class ValidationGroup3(etree.ElementBase):
     from third parties once the data set has been published or additional reviewer
     comments from an additional external review."""
 
-    @property
-    def referenceToNameOfReviewerAndInstitution(self) -> "GlobalReference":
-        """ "Contact data set" of reviewer. The full name of reviewer(s) and
-        institution(s) as well as a contact address and/or email should be
-        provided in that contact data set."""
-        return get_element(self, "common:referenceToNameOfReviewerAndInstitution")
+    referenceToNameOfReviewerAndInstitution: "GlobalReference" = create_element_common(
+        "referenceToNameOfReviewerAndInstitution"
+    )
+    """ "Contact data set" of reviewer. The full name of reviewer(s) and
+    institution(s) as well as a contact address and/or email should be
+    provided in that contact data set."""
 
-    @property
-    def referenceToCompleteReviewReport(self) -> "GlobalReference":
-        """ ""Source data set" of the complete review report."""
-        return get_element(self, "common:referenceToCompleteReviewReport")
+    referenceToCompleteReviewReport: "GlobalReference" = create_element_common(
+        "referenceToCompleteReviewReport"
+    )
+    """ ""Source data set" of the complete review report."""
 
 
 class ComplianceGroup(etree.ElementBase):
@@ -210,11 +210,11 @@ class ComplianceGroup(etree.ElementBase):
     approval should be issued/confirmed by the owner of that compliance
     system, who is identified via the respective "Contact data set"."""
 
-    @property
-    def referenceToComplianceSystem(self) -> "GlobalReference":
-        """Source data set" of the "Compliance system" that is declared to
-        be met by the data set."""
-        return get_element(self, "common:referenceToComplianceSystem")
+    referenceToComplianceSystem: "GlobalReference" = create_element_common(
+        "referenceToComplianceSystem"
+    )
+    """Source data set" of the "Compliance system" that is declared to
+    be met by the data set."""
 
 
 class CommissionerAndGoal(etree.ElementBase):
@@ -233,15 +233,15 @@ class CommissionerAndGoal(etree.ElementBase):
     and data set modelling. This indicates / includes information on
     the level of detail, the specifidity, and the quality ambition inthe effort."""
 
-    @property
-    def referenceToCommissioner(self) -> List["GlobalReference"]:
-        """ "Contact data set" of the commissioner / financing party
-        of the data collection / compilation and of the data set
-        modelling. For groups of commissioners, each single organisation
-        should be named. For data set updates and for direct use of data
-        from formerly commissioned studies, also the original commissioner
-        should be named."""
-        return get_element_list(self, "common:referenceToCommissioner")
+    referenceToCommissioner: List["GlobalReference"] = create_element_list_common(
+        "referenceToCommissioner"
+    )
+    """ "Contact data set" of the commissioner / financing party
+    of the data collection / compilation and of the data set
+    modelling. For groups of commissioners, each single organisation
+    should be named. For data set updates and for direct use of data
+    from formerly commissioned studies, also the original commissioner
+    should be named."""
 
 
 class DataEntryByGroup1(etree.ElementBase):
@@ -251,26 +251,26 @@ class DataEntryByGroup1(etree.ElementBase):
     """Date and time stamp of data set generation, typically an automated
     entry ("last saved")."""
 
-    @property
-    def referenceToDataSetFormat(self) -> List["GlobalReference"]:
-        """ "Source data set" of the used version of the ILCD format.
-        If additional data format fields have been integrated into the
-        data set file, using the "namespace" option, the used format
-        namespace(s) are to be given. This is the case if the data sets
-        carries additional information as specified by other, particular
-        LCA formats, e.g. of other database networks or LCA softwares."""
-        return get_element_list(self, "common:referenceToDataSetFormat")
+    referenceToDataSetFormat: List["GlobalReference"] = create_element_list_common(
+        "referenceToDataSetFormat"
+    )
+    """ "Source data set" of the used version of the ILCD format.
+    If additional data format fields have been integrated into the
+    data set file, using the "namespace" option, the used format
+    namespace(s) are to be given. This is the case if the data sets
+    carries additional information as specified by other, particular
+    LCA formats, e.g. of other database networks or LCA softwares."""
 
 
 class DataEntryByGroup2(etree.ElementBase):
     """Common group."""
 
-    @property
-    def referenceToPersonOrEntityEnteringTheData(self) -> "GlobalReference":
-        """ ""Contact data set" of the responsible person or entity that
-        has documented this data set, i.e. entered the data and the
-        descriptive information."""
-        return get_element(self, "common:referenceToPersonOrEntityEnteringTheData")
+    referenceToPersonOrEntityEnteringTheData: "GlobalReference" = create_element_common(
+        "referenceToPersonOrEntityEnteringTheData"
+    )
+    """ ""Contact data set" of the responsible person or entity that
+    has documented this data set, i.e. entered the data and the
+    descriptive information."""
 
 
 class PublicationAndOwnershipGroup1(etree.ElementBase):
@@ -295,12 +295,12 @@ class PublicationAndOwnershipGroup1(etree.ElementBase):
     point, e.g. by combining the data owner's www path with the data set's UUID, e.g.
     http://www.mycompany.com/lca/processes/50f12420-8855-12db-b606-0900210c9a66.]"""
 
-    @property
-    def referenceToPrecedingDataSetVersion(self) -> List["GlobalReference"]:
-        """Last preceding data set, which was replaced by this version.
-        Either a URI of that data set (i.e. an internet address) or its
-        UUID plus version number is given (or both)."""
-        return get_element_list(self, "common:referenceToPrecedingDataSetVersion")
+    referenceToPrecedingDataSetVersion: List["GlobalReference"] = (
+        create_element_list_common("referenceToPrecedingDataSetVersion")
+    )
+    """Last preceding data set, which was replaced by this version.
+    Either a URI of that data set (i.e. an internet address) or its
+    UUID plus version number is given (or both)."""
 
 
 class PublicationAndOwnershipGroup2(etree.ElementBase):
@@ -313,16 +313,16 @@ class PublicationAndOwnershipGroup2(etree.ElementBase):
     foreseen publication dates should be provided on request by th
     "Data set owner"."""
 
-    @property
-    def referenceToUnchangedRepublication(self) -> "GlobalReference":
-        """ "Source data set" of the publication, in which this
-        data set was published for the first time. [Note: This
-        refers to exactly this data set as it is, without any format
-        conversion, adjustments, flow name mapping, etc. In case this
-        data set was modified/converted, the original source is
-        documented in "Converted original data set from:" in section
-        "Data entry by".]"""
-        return get_element(self, "common:referenceToUnchangedRepublication")
+    referenceToUnchangedRepublication: "GlobalReference" = create_element_common(
+        "referenceToUnchangedRepublication"
+    )
+    """ "Source data set" of the publication, in which this
+    data set was published for the first time. [Note: This
+    refers to exactly this data set as it is, without any format
+    conversion, adjustments, flow name mapping, etc. In case this
+    data set was modified/converted, the original source is
+    documented in "Converted original data set from:" in section
+    "Data entry by".]"""
 
 
 class PublicationAndOwnershipGroup3(etree.ElementBase):
@@ -343,14 +343,14 @@ class PublicationAndOwnershipGroup3(etree.ElementBase):
     or referring to e.g. license conditions. In case of no restrictions
     "None" is entered."""
 
-    @property
-    def referenceToEntitiesWithExclusiveAccess(self) -> List["GlobalReference"]:
-        """ "Contact data set" of those entities or persons (or
-        groups of these), to which an exclusive access to this
-        data set is granted. Mainly intended to be used in
-        confidentiality management in projects. [Note: See also
-        field "Access and use restrictions".]"""
-        return get_element_list(self, "common:referenceToEntitiesWithExclusiveAccess")
+    referenceToEntitiesWithExclusiveAccess: List["GlobalReference"] = (
+        create_element_list_common("referenceToEntitiesWithExclusiveAccess")
+    )
+    """ "Contact data set" of those entities or persons (or
+    groups of these), to which an exclusive access to this
+    data set is granted. Mainly intended to be used in
+    confidentiality management in projects. [Note: See also
+    field "Access and use restrictions".]"""
 
 
 class FlowCategoryInformation(etree.ElementBase):
@@ -360,17 +360,17 @@ class FlowCategoryInformation(etree.ElementBase):
     should nevertheless be avoided to use identical names for Flow properties
     in the same class."""
 
-    @property
-    def elementaryFlowCategorization(self) -> List["FlowCategorization"]:
-        """Identifying category/compartment information exclusively used for
-        elementary flows. E.g. "Emission to air", "Renewable resource", etc."""
-        return get_element_list(self, "common:elementaryFlowCategorization")
+    elementaryFlowCategorization: List["FlowCategorization"] = (
+        create_element_list_common("elementaryFlowCategorization")
+    )
+    """Identifying category/compartment information exclusively used for
+    elementary flows. E.g. "Emission to air", "Renewable resource", etc."""
 
-    @property
-    def classifications(self) -> List["Classification"]:
-        """Optional statistical or other classification of the data set.
-        Typically also used for structuring LCA databases."""
-        return get_element_list(self, "common:classification")
+    classifications: List["Classification"] = create_element_list_common(
+        "classification"
+    )
+    """Optional statistical or other classification of the data set.
+    Typically also used for structuring LCA databases."""
 
 
 class FlowCategorization(etree.ElementBase):
@@ -388,10 +388,8 @@ class FlowCategorization(etree.ElementBase):
     "ILCDCategories.xml" format. If a category file is specified, only
     categories of the referenced categories file should be used.]"""
 
-    @property
-    def categoryList(self) -> List["Category"]:
-        """Name of the category of this elementary flow.."""
-        return get_element_list(self, "common:category")
+    categoryList: List["Category"] = create_element_list_common("category")
+    """Name of the category of this elementary flow.."""
 
 
 class Category(etree.ElementBase):
@@ -414,10 +412,12 @@ class ComplianceDeclarations(etree.ElementBase):
     EPD scheme, handbook of a national or international data network such
     as the ILCD, etc.)."""
 
-    @property
-    def compliances(self) -> List["Compliance"]:
-        """One compliance declaration"""
-        return get_element_list(self, "compliance")
+    compliances: List["Compliance"] = ChildElementList(
+        get_tag("compliance", NAMESPACE_FLOW_DATASET),
+        get_tag("compliance", NAMESPACE_FLOW_PROPERTY_DATASET),
+        get_tag("compliance", NAMESPACE_UNIT_GROUP_DATASET),
+    )
+    """One compliance declaration"""
 
 
 class Compliance(ComplianceGroup):
@@ -32,6 +32,7 @@ class Defaults:
     SCHEMA_SOURCE_DATASET: ClassVar[str] = os.path.join(
         SCHEMA_DIR, "ILCD_SourceDataSet.xsd"
     )
+    SCHEMA_XML: ClassVar[str] = os.path.join(SCHEMA_DIR, "xml.xsd")
 
     DYNAMIC_DEFAULTS: ClassVar[
         Dict[str, Dict[str, Callable[[etree.ElementBase], str]]]
@@ -3,7 +3,6 @@
 from typing import List
 
 from lxml import etree
-from lxmlh import get_element, get_element_list
 
 from .common import (
     ClassificationInformation,
@@ -14,6 +13,8 @@ from .common import (
 from .helpers import (
     create_attribute_contact_dataset,
     create_attribute_list_contact_dataset,
+    create_element_contact_dataset,
+    create_element_list_contact_dataset,
     create_element_text_contact_dataset,
 )
 
@@ -24,41 +25,39 @@ class ContactDataSet(etree.ElementBase):
     version = create_attribute_contact_dataset("version", str)
     """Indicates, which version of the ILCD format is used."""
 
-    @property
-    def contactInformation(self) -> "ContactInformation":
-        """Contact information,"""
-        return get_element(self, "contactInformation")
+    contactInformation: "ContactInformation" = create_element_contact_dataset(
+        "contactInformation"
+    )
+    """Contact information,"""
 
-    @property
-    def administrativeInformation(self) -> "AdministrativeInformation":
-        """Information on data set management and administration."""
-        return get_element(self, "administrativeInformation")
+    administrativeInformation: "AdministrativeInformation" = (
+        create_element_contact_dataset("administrativeInformation")
+    )
+    """Information on data set management and administration."""
 
 
 class ContactInformation(etree.ElementBase):
     """Contact information."""
 
-    @property
-    def dataSetInformation(self) -> "DataSetInformation":
-        """Data set information."""
-        return get_element(self, "dataSetInformation")
+    dataSetInformation: "DataSetInformation" = create_element_contact_dataset(
+        "dataSetInformation"
+    )
+    """Data set information."""
 
 
 class AdministrativeInformation(etree.ElementBase):
     """Information on data set management and administration."""
 
-    @property
-    def dataEntryBy(self) -> "DataEntryBy":
-        """Staff or entity, that documented the generated data set,
-        entering the information into the database; plus administrative
-        information linked to the data entry activity."""
-        return get_element(self, "dataEntryBy")
+    dataEntryBy: "DataEntryBy" = create_element_contact_dataset("dataEntryBy")
+    """Staff or entity, that documented the generated data set,
+    entering the information into the database; plus administrative
+    information linked to the data entry activity."""
 
-    @property
-    def publicationAndOwnership(self) -> "PublicationAndOwnership":
-        """Information related to publication and version management of
-        the data set including copyright and access restrictions."""
-        return get_element(self, "publicationAndOwnership")
+    publicationAndOwnership: "PublicationAndOwnership" = create_element_contact_dataset(
+        "publicationAndOwnership"
+    )
+    """Information related to publication and version management of
+    the data set including copyright and access restrictions."""
 
 
 class DataSetInformation(etree.ElementBase):
@@ -110,29 +109,29 @@ class DataSetInformation(etree.ElementBase):
     """Free text for additional description of the organisation or person of
     the contact, such as organisational profile, person responsibilities, etc."""
 
-    @property
-    def classificationInformation(self) -> "ClassificationInformation":
-        """Hierachical classification of the contact foreseen to be used to
-        structure the contact content of the database. (Note: This entry is
-        NOT required for the identification of the contact data set. It should
-        nevertheless be avoided to use identical names for contacts in the same
-        class."""
-        return get_element(self, "classificationInformation")
-
-    @property
-    def referenceToContact(self) -> List["GlobalReference"]:
-        """ "Contact data set"s of working groups, organisations or database
-        networks to which EITHER this person or entity OR this database, data set
-        format, or compliance system belongs. [Note: This does not necessarily
-        imply a legally binding relationship, but may also be a voluntary
-        membership.]"""
-        return get_element_list(self, "referenceToContact")
-
-    @property
-    def referenceToLogo(self) -> "GlobalReference":
-        """ "Source data set" of the logo of the organisation or source to
-        be used in reports etc."""
-        return get_element(self, "referenceToLogo")
+    classificationInformation: "ClassificationInformation" = (
+        create_element_contact_dataset("classificationInformation")
+    )
+    """Hierachical classification of the contact foreseen to be used to
+    structure the contact content of the database. (Note: This entry is
+    NOT required for the identification of the contact data set. It should
+    nevertheless be avoided to use identical names for contacts in the same
+    class."""
+
+    referenceToContact: List["GlobalReference"] = create_element_list_contact_dataset(
+        "referenceToContact"
+    )
+    """ "Contact data set"s of working groups, organisations or database
+    networks to which EITHER this person or entity OR this database, data set
+    format, or compliance system belongs. [Note: This does not necessarily
+    imply a legally binding relationship, but may also be a voluntary
+    membership.]"""
+
+    referenceToLogo: "GlobalReference" = create_element_contact_dataset(
+        "referenceToLogo"
+    )
+    """ "Source data set" of the logo of the organisation or source to
+    be used in reports etc."""
 
 
 class DataEntryBy(DataEntryByGroup1):
@@ -145,8 +144,8 @@ class PublicationAndOwnership(PublicationAndOwnershipGroup1):
     """Information related to publication and version management of
     the data set including copyright and access restrictions."""
 
-    @property
-    def referenceToOwnershipOfDataSet(self) -> "GlobalReference":
-        """ "Contact data set" of the person or entity who owns this data
-        set. (Note: this is not necessarily the publisher of the data set.)"""
-        return get_element(self, "common:referenceToOwnershipOfDataSet")
+    referenceToOwnershipOfDataSet: "GlobalReference" = create_element_contact_dataset(
+        "common:referenceToOwnershipOfDataSet"
+    )
+    """ "Contact data set" of the person or entity who owns this data
+    set. (Note: this is not necessarily the publisher of the data set.)"""
@@ -1,19 +1,25 @@
 """Core ILCD module containing parsing and saving functionalities."""
 
+import tempfile
+import zipfile
+from collections import defaultdict
+from functools import lru_cache
 from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Tuple, Union
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from lxml import etree
-from lxmlh import (
-    parse_directory,
-    parse_file,
-    parse_zip_file,
-    save_file,
-    validate_directory,
-    validate_file,
-    validate_zip_file,
-)
+from lxmlh import save_file
 
 from .common import (
     Category,
@@ -66,6 +72,17 @@ from .flow_property_dataset import (
 from .flow_property_dataset import (
     QuantitativeReference as FlowPropertyQuantitativeReference,
 )
+from .helpers import (
+    NAMESPACE_COMMON,
+    NAMESPACE_CONTACT_DATASET,
+    NAMESPACE_FLOW_DATASET,
+    NAMESPACE_FLOW_PROPERTY_DATASET,
+    NAMESPACE_PROCESS_DATASET,
+    NAMESPACE_SOURCE_DATASET,
+    NAMESPACE_UNIT_GROUP_DATASET,
+    get_schema,
+    get_tag,
+)
 from .process_dataset import (
     AdministrativeInformation as ProcessAdministrativeInformation,
 )
@@ -205,150 +222,245 @@ COMMON_LOOK_UP: Dict[str, type] = {
     "variableParameter": VariableParameter,
 }
 
+_DATASET_UUID: etree.XPath = etree.XPath(
+    "string(*/*/common:UUID)",
+    namespaces={"common": NAMESPACE_COMMON},
+    smart_strings=False,
+)
+_DATASET_VERSION: etree.XPath = etree.XPath(
+    "string(*/*/common:dataSetVersion)",
+    namespaces={"common": NAMESPACE_COMMON},
+    smart_strings=False,
+)
 
-def _check_common_lookup(name: str) -> type:
-    try:
-        return COMMON_LOOK_UP[name]
-    except KeyError:
-        return None
 
+class _DatasetLookup(etree.ElementNamespaceClassLookup):
+    """Base XML lookup class mapping the elements of an ILCD dataset namespace and
+    of the ILCD common namespace to custom ILCD classes. The classes are registered
+    once per lookup, so lxml resolves them from its namespace registries without
+    calling back into Python for each new element proxy."""
 
-class ProcessDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE: str = ""
+    LOOKUP_MAP: Dict[str, type] = {}
+
+    def __init__(self) -> None:
+        super().__init__()
+        lookupMap = {**COMMON_LOOK_UP, **self.LOOKUP_MAP}
+        for namespace in (self.NAMESPACE, NAMESPACE_COMMON):
+            self.get_namespace(namespace).update(lookupMap)
+
+
+class ProcessDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD ProcessDataset files."""
 
-    def lookup(self, unused_node_type, unused_document, unused_namespace, name) -> type:
-        """Maps ILCD ProcessDataset XML elements to custom ProcessDataset classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": ProcessAdministrativeInformation,
-            "dataEntryBy": ProcessDataEntryBy,
-            "dataSetInformation": ProcessDataSetInformation,
-            "dataSourcesTreatmentAndRepresentativeness": PDSTAR,
-            "classificationInformation": ClassificationInformation,
-            "compliance": ProcessCompliance,
-            "complianceDeclarations": ProcessComplianceDeclarations,
-            "geography": ProcessGeography,
-            "modellingAndValidation": ProcessModellingAndValidation,
-            "name": ProcessName,
-            "publicationAndOwnership": ProcessPublicationAndOwnership,
-            "quantitativeReference": ProcessQuantitativeReference,
-            "technology": ProcessTechnology,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
-
-
-class FlowDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_PROCESS_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": ProcessAdministrativeInformation,
+        "dataEntryBy": ProcessDataEntryBy,
+        "dataSetInformation": ProcessDataSetInformation,
+        "dataSourcesTreatmentAndRepresentativeness": PDSTAR,
+        "classificationInformation": ClassificationInformation,
+        "compliance": ProcessCompliance,
+        "complianceDeclarations": ProcessComplianceDeclarations,
+        "geography": ProcessGeography,
+        "modellingAndValidation": ProcessModellingAndValidation,
+        "name": ProcessName,
+        "publicationAndOwnership": ProcessPublicationAndOwnership,
+        "quantitativeReference": ProcessQuantitativeReference,
+        "technology": ProcessTechnology,
+    }
+
+
+class FlowDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD FlowDataset files."""
 
-    def lookup(
-        self, unused_node_type, unused_document, unused_namespace, name: str
-    ) -> type:
-        """Maps ILCD FlowDataset XML elements to custom FlowDataset classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": FlowAdministrativeInformation,
-            "classificationInformation": FlowCategoryInformation,
-            "dataEntryBy": FlowDataEntryBy,
-            "dataSetInformation": FlowDataSetInformation,
-            "geography": FlowGeography,
-            "modellingAndValidation": FlowModellingAndValidation,
-            "name": FlowName,
-            "publicationAndOwnership": FlowPublicationAndOwnership,
-            "quantitativeReference": FlowQuantitativeReference,
-            "technology": FlowTechnology,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
-
-
-class FlowPropertyDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_FLOW_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": FlowAdministrativeInformation,
+        "classificationInformation": FlowCategoryInformation,
+        "dataEntryBy": FlowDataEntryBy,
+        "dataSetInformation": FlowDataSetInformation,
+        "geography": FlowGeography,
+        "modellingAndValidation": FlowModellingAndValidation,
+        "name": FlowName,
+        "publicationAndOwnership": FlowPublicationAndOwnership,
+        "quantitativeReference": FlowQuantitativeReference,
+        "technology": FlowTechnology,
+    }
+
+
+class FlowPropertyDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD FlowPropertyDataset files."""
 
-    def lookup(
-        self, unused_node_type, unused_document, unused_namespace, name: str
-    ) -> type:
-        """Maps ILCD FlowPropertyDataset XML elements to custom FlowPropertyDataset
-        classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": FlowPropertyAdministrativeInformation,
-            "classificationInformation": ClassificationInformation,
-            "dataEntryBy": FlowPropertyDataEntryBy,
-            "dataSetInformation": FlowPropertyDataSetInformation,
-            "dataSourcesTreatmentAndRepresentativeness": FPDSTAR,
-            "modellingAndValidation": FlowPropertyModellingAndValidation,
-            "publicationAndOwnership": FlowPropertyPublicationAndOwnership,
-            "quantitativeReference": FlowPropertyQuantitativeReference,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
-
-
-class UnitGroupDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_FLOW_PROPERTY_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": FlowPropertyAdministrativeInformation,
+        "classificationInformation": ClassificationInformation,
+        "dataEntryBy": FlowPropertyDataEntryBy,
+        "dataSetInformation": FlowPropertyDataSetInformation,
+        "dataSourcesTreatmentAndRepresentativeness": FPDSTAR,
+        "modellingAndValidation": FlowPropertyModellingAndValidation,
+        "publicationAndOwnership": FlowPropertyPublicationAndOwnership,
+        "quantitativeReference": FlowPropertyQuantitativeReference,
+    }
+
+
+class UnitGroupDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD UnitGroupDataset files."""
 
-    def lookup(
-        self, unused_node_type, unused_document, unused_namespace, name: str
-    ) -> type:
-        """Maps ILCD UnitGroupDataset XML elements to custom UnitGroupDataset
-        classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": UnitGroupAdministrativeInformation,
-            "classificationInformation": ClassificationInformation,
-            "dataEntryBy": UnitGroupDataEntryBy,
-            "dataSetInformation": UnitGroupDataSetInformation,
-            "modellingAndValidation": UnitGroupModellingAndValidation,
-            "publicationAndOwnership": UnitGroupPublicationAndOwnership,
-            "quantitativeReference": UnitGroupQuantitativeReference,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
-
-
-class ContactDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_UNIT_GROUP_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": UnitGroupAdministrativeInformation,
+        "classificationInformation": ClassificationInformation,
+        "dataEntryBy": UnitGroupDataEntryBy,
+        "dataSetInformation": UnitGroupDataSetInformation,
+        "modellingAndValidation": UnitGroupModellingAndValidation,
+        "publicationAndOwnership": UnitGroupPublicationAndOwnership,
+        "quantitativeReference": UnitGroupQuantitativeReference,
+    }
+
+
+class ContactDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD ContactDataset files."""
 
-    def lookup(
-        self, unused_node_type, unused_document, unused_namespace, name: str
-    ) -> type:
-        """Maps ILCD ContactDataset XML elements to custom ContactDataset classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": ContactAdministrativeInformation,
-            "dataEntryBy": ContactDataEntryBy,
-            "dataSetInformation": ContactDataSetInformation,
-            "classificationInformation": ClassificationInformation,
-            "publicationAndOwnership": ContactPublicationAndOwnership,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
-
-
-class SourceDatasetLookup(etree.CustomElementClassLookup):
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_CONTACT_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": ContactAdministrativeInformation,
+        "dataEntryBy": ContactDataEntryBy,
+        "dataSetInformation": ContactDataSetInformation,
+        "classificationInformation": ClassificationInformation,
+        "publicationAndOwnership": ContactPublicationAndOwnership,
+    }
+
+
+class SourceDatasetLookup(_DatasetLookup):
     """Custom XML lookup class for ILCD SourceDataset files."""
 
-    def lookup(
-        self, unused_node_type, unused_document, unused_namespace, name: str
-    ) -> type:
-        """Maps ILCD SourceDataset XML elements to custom SourceDataset classes."""
-        lookupMap: Dict[str, type] = {
-            "administrativeInformation": SourceAdministrativeInformation,
-            "dataEntryBy": SourceDataEntryBy,
-            "dataSetInformation": SourceDataSetInformation,
-            "classificationInformation": ClassificationInformation,
-            "publicationAndOwnership": SourcePublicationAndOwnership,
-        }
-        try:
-            return lookupMap[name]
-        except KeyError:
-            return _check_common_lookup(name)
+    __slots__ = ()
+
+    NAMESPACE = NAMESPACE_SOURCE_DATASET
+    LOOKUP_MAP: Dict[str, type] = {
+        "administrativeInformation": SourceAdministrativeInformation,
+        "dataEntryBy": SourceDataEntryBy,
+        "dataSetInformation": SourceDataSetInformation,
+        "classificationInformation": ClassificationInformation,
+        "publicationAndOwnership": SourcePublicationAndOwnership,
+    }
+
+
+@lru_cache(maxsize=None)
+def _get_lookup(lookup_class: Type[_DatasetLookup]) -> _DatasetLookup:
+    """Creates a lookup once per dataset type. Lookups aren't changed after
+    creation, so unlike parsers they can be shared by all threads."""
+    return lookup_class()
+
+
+def _get_parser(
+    schema_path: Optional[str], lookup_class: Type[_DatasetLookup]
+) -> etree.XMLParser:
+    """Creates a parser for a dataset type, which validates against the schema
+    unless it's ``None``. A new parser is created for each parse, since a parser
+    can't be used by several threads at once, while the compiled schema and the
+    lookup are shared. Blank text isn't kept and ID attributes aren't collected as
+    ILCD datasets don't rely on either."""
+    parser = etree.XMLParser(
+        remove_blank_text=True,
+        schema=None if schema_path is None else get_schema(schema_path),
+        collect_ids=False,
+    )
+    parser.set_element_class_lookup(_get_lookup(lookup_class))
+    return parser
+
+
+def _parse_file(
+    file: Union[str, Path, StringIO],
+    schema_path: str,
+    lookup_class: Type[_DatasetLookup],
+    validate: bool = True,
+) -> etree.ElementBase:
+    """Parses and validates an XML file to custom classes, like lxmlh.parse_file
+    but with the schema compiled once per dataset type. Validation is skipped if
+    ``validate`` is False."""
+    parser = _get_parser(schema_path if validate else None, lookup_class)
+    return etree.parse(file, parser).getroot()
+
+
+def _parse_directory(
+    dir_path: Union[str, Path],
+    schema_path: str,
+    lookup_class: Type[_DatasetLookup],
+    valid_suffixes: List[str],
+) -> List[Tuple[Path, etree.ElementBase]]:
+    """Parses a directory of XML files to a list of custom classes, like
+    lxmlh.parse_directory but through _parse_file."""
+    dir_path = Path(dir_path).resolve()
+    return [
+        (file_path, _parse_file(file_path, schema_path, lookup_class))
+        for file_path in dir_path.iterdir()
+        if file_path.is_file() and file_path.suffix.lower() in valid_suffixes
+    ]
+
+
+def _parse_zip_file(
+    file_path: Union[str, Path],
+    schema_path: str,
+    lookup_class: Type[_DatasetLookup],
+    valid_suffixes: List[str],
+) -> List[Tuple[Path, etree.ElementBase]]:
+    """Parses a ZIP file of XML files to a list of custom classes, like
+    lxmlh.parse_zip_file but through _parse_file."""
+    with tempfile.TemporaryDirectory() as unzipDir:
+        with zipfile.ZipFile(file_path, "r") as zipFile:
+            zipFile.extractall(unzipDir)
+            return _parse_directory(unzipDir, schema_path, lookup_class, valid_suffixes)
+
+
+def _validate_file(
+    file: Union[str, Path, StringIO], schema_path: str
+) -> Union[None, List[str]]:
+    """Validates an XML file against a schema, like lxmlh.validate_file but with
+    the schema compiled once per path."""
+    schema = get_schema(schema_path)
+    doc = etree.parse(file)
+    if not schema.validate(doc):
+        return schema.error_log
+    return None
+
+
+def _validate_directory(
+    dir_path: Union[str, Path], schema_path: str, valid_suffixes: List[str]
+) -> List[Tuple[Path, Union[None, List[str]]]]:
+    """Validates a directory of XML files against a schema, like
+    lxmlh.validate_directory but through _validate_file."""
+    dir_path = Path(dir_path).resolve()
+    return [
+        (file_path, _validate_file(file_path, schema_path))
+        for file_path in dir_path.iterdir()
+        if file_path.is_file() and file_path.suffix.lower() in valid_suffixes
+    ]
+
+
+def _validate_zip_file(
+    file_path: Union[str, Path], schema_path: str, valid_suffixes: List[str]
+) -> List[Tuple[Path, Union[None, List[str]]]]:
+    """Validates a ZIP file of XML files against a schema, like
+    lxmlh.validate_zip_file but through _validate_directory."""
+    with tempfile.TemporaryDirectory() as unzipDir:
+        with zipfile.ZipFile(file_path, "r") as zipFile:
+            zipFile.extractall(unzipDir)
+            return _validate_directory(unzipDir, schema_path, valid_suffixes)
 
 
 def validate_file_process_dataset(
@@ -360,7 +472,7 @@ def validate_file_process_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_PROCESS_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_PROCESS_DATASET)
 
 
 def validate_file_flow_dataset(
@@ -372,7 +484,7 @@ def validate_file_flow_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_FLOW_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_FLOW_DATASET)
 
 
 def validate_file_flow_property_dataset(
@@ -384,7 +496,7 @@ def validate_file_flow_property_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_FLOW_PROPERTY_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_FLOW_PROPERTY_DATASET)
 
 
 def validate_file_unit_group_dataset(
@@ -396,7 +508,7 @@ def validate_file_unit_group_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_UNIT_GROUP_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_UNIT_GROUP_DATASET)
 
 
 def validate_file_contact_dataset(
@@ -408,7 +520,7 @@ def validate_file_contact_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_CONTACT_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_CONTACT_DATASET)
 
 
 def validate_file_source_dataset(
@@ -420,7 +532,7 @@ def validate_file_source_dataset(
     representation.
     Returns ``None`` if valid or a list of error strings.
     """
-    return validate_file(file, Defaults.SCHEMA_SOURCE_DATASET)
+    return _validate_file(file, Defaults.SCHEMA_SOURCE_DATASET)
 
 
 def validate_directory_process_dataset(
@@ -437,7 +549,7 @@ def validate_directory_process_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_PROCESS_DATASET,
         valid_suffixes=valid_suffixes,
@@ -458,7 +570,7 @@ def validate_directory_flow_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_FLOW_DATASET,
         valid_suffixes=valid_suffixes,
@@ -479,7 +591,7 @@ def validate_directory_flow_property_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_FLOW_PROPERTY_DATASET,
         valid_suffixes=valid_suffixes,
@@ -500,7 +612,7 @@ def validate_directory_unit_group_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_UNIT_GROUP_DATASET,
         valid_suffixes=valid_suffixes,
@@ -521,7 +633,7 @@ def validate_directory_contact_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_CONTACT_DATASET,
         valid_suffixes=valid_suffixes,
@@ -542,7 +654,7 @@ def validate_directory_source_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_directory(
+    return _validate_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_SOURCE_DATASET,
         valid_suffixes=valid_suffixes,
@@ -563,7 +675,7 @@ def validate_zip_file_process_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_PROCESS_DATASET,
         valid_suffixes=valid_suffixes,
@@ -584,7 +696,7 @@ def validate_zip_file_flow_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_FLOW_DATASET,
         valid_suffixes=valid_suffixes,
@@ -605,7 +717,7 @@ def validate_zip_file_flow_property_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_FLOW_PROPERTY_DATASET,
         valid_suffixes=valid_suffixes,
@@ -626,7 +738,7 @@ def validate_zip_file_unit_group_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_UNIT_GROUP_DATASET,
         valid_suffixes=valid_suffixes,
@@ -647,7 +759,7 @@ def validate_zip_file_contact_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_CONTACT_DATASET,
         valid_suffixes=valid_suffixes,
@@ -668,77 +780,105 @@ def validate_zip_file_source_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return validate_zip_file(
+    return _validate_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_SOURCE_DATASET,
         valid_suffixes=valid_suffixes,
     )
 
 
-def parse_file_process_dataset(file: Union[str, Path, StringIO]) -> ProcessDataSet:
+def parse_file_process_dataset(
+    file: Union[str, Path, StringIO], validate: bool = True
+) -> ProcessDataSet:
     """Parses an ILCD Process Dataset XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the ProcessDataset XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a ProcessDataset class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_PROCESS_DATASET, ProcessDatasetLookup())
+    return _parse_file(
+        file, Defaults.SCHEMA_PROCESS_DATASET, ProcessDatasetLookup, validate
+    )
 
 
-def parse_file_flow_dataset(file: Union[str, Path, StringIO]) -> FlowDataSet:
+def parse_file_flow_dataset(
+    file: Union[str, Path, StringIO], validate: bool = True
+) -> FlowDataSet:
     """Parses an ILCD Flow DataSet XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the Flow DataSet XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a FlowDataSet class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_FLOW_DATASET, FlowDatasetLookup())
+    return _parse_file(file, Defaults.SCHEMA_FLOW_DATASET, FlowDatasetLookup, validate)
 
 
 def parse_file_flow_property_dataset(
-    file: Union[str, Path, StringIO]
+    file: Union[str, Path, StringIO], validate: bool = True
 ) -> FlowPropertyDataSet:
     """Parses an ILCD Flow Property DataSet XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the Flow Property DataSet XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a FlowPropertyDataSet class representing the root of the XML file.
     """
-    return parse_file(
-        file, Defaults.SCHEMA_FLOW_PROPERTY_DATASET, FlowPropertyDatasetLookup()
+    return _parse_file(
+        file, Defaults.SCHEMA_FLOW_PROPERTY_DATASET, FlowPropertyDatasetLookup, validate
     )
 
 
-def parse_file_unit_group_dataset(file: Union[str, Path, StringIO]) -> UnitGroupDataSet:
+def parse_file_unit_group_dataset(
+    file: Union[str, Path, StringIO], validate: bool = True
+) -> UnitGroupDataSet:
     """Parses an ILCD Unit Group DataSet XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the Unit Group DataSet XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a UnitGroupDataSet class representing the root of the XML file.
     """
-    return parse_file(
-        file, Defaults.SCHEMA_UNIT_GROUP_DATASET, UnitGroupDatasetLookup()
+    return _parse_file(
+        file, Defaults.SCHEMA_UNIT_GROUP_DATASET, UnitGroupDatasetLookup, validate
     )
 
 
-def parse_file_contact_dataset(file: Union[str, Path, StringIO]) -> ContactDataSet:
+def parse_file_contact_dataset(
+    file: Union[str, Path, StringIO], validate: bool = True
+) -> ContactDataSet:
     """Parses an ILCD Contact DataSet XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the Contact DataSet XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a ContactDataSet class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_CONTACT_DATASET, ContactDatasetLookup())
+    return _parse_file(
+        file, Defaults.SCHEMA_CONTACT_DATASET, ContactDatasetLookup, validate
+    )
 
 
-def parse_file_source_dataset(file: Union[str, Path, StringIO]) -> SourceDataSet:
+def parse_file_source_dataset(
+    file: Union[str, Path, StringIO], validate: bool = True
+) -> SourceDataSet:
     """Parses an ILCD Source DataSet XML file to custom ILCD classes.
     Parameters:
     file: the str|Path path to the Source DataSet XML file or its StringIO
     representation.
+    validate: whether to validate the file against the schema while parsing,
+    which can be skipped for trusted files as it takes most of the parsing time.
     Returns a SourceDataSet class representing the root of the XML file.
     """
-    return parse_file(file, Defaults.SCHEMA_SOURCE_DATASET, SourceDatasetLookup())
+    return _parse_file(
+        file, Defaults.SCHEMA_SOURCE_DATASET, SourceDatasetLookup, validate
+    )
 
 
 def parse_directory_process_dataset(
@@ -756,10 +896,10 @@ def parse_directory_process_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_PROCESS_DATASET,
-        lookup=ProcessDatasetLookup(),
+        lookup_class=ProcessDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -779,10 +919,10 @@ def parse_directory_flow_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_FLOW_DATASET,
-        lookup=FlowDatasetLookup(),
+        lookup_class=FlowDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -802,10 +942,10 @@ def parse_directory_flow_property_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_FLOW_PROPERTY_DATASET,
-        lookup=FlowPropertyDatasetLookup(),
+        lookup_class=FlowPropertyDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -825,10 +965,10 @@ def parse_directory_unit_group_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_UNIT_GROUP_DATASET,
-        lookup=UnitGroupDatasetLookup(),
+        lookup_class=UnitGroupDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -848,10 +988,10 @@ def parse_directory_contact_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_CONTACT_DATASET,
-        lookup=ContactDatasetLookup(),
+        lookup_class=ContactDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -871,10 +1011,10 @@ def parse_directory_source_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_directory(
+    return _parse_directory(
         dir_path=dir_path,
         schema_path=Defaults.SCHEMA_SOURCE_DATASET,
-        lookup=SourceDatasetLookup(),
+        lookup_class=SourceDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -894,10 +1034,10 @@ def parse_zip_file_process_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_PROCESS_DATASET,
-        lookup=ProcessDatasetLookup(),
+        lookup_class=ProcessDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -917,10 +1057,10 @@ def parse_zip_file_flow_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_FLOW_DATASET,
-        lookup=FlowDatasetLookup(),
+        lookup_class=FlowDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -940,10 +1080,10 @@ def parse_zip_file_flow_property_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_FLOW_PROPERTY_DATASET,
-        lookup=FlowPropertyDatasetLookup(),
+        lookup_class=FlowPropertyDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -963,10 +1103,10 @@ def parse_zip_file_unit_group_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_UNIT_GROUP_DATASET,
-        lookup=UnitGroupDatasetLookup(),
+        lookup_class=UnitGroupDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -986,10 +1126,10 @@ def parse_zip_file_contact_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_CONTACT_DATASET,
-        lookup=ContactDatasetLookup(),
+        lookup_class=ContactDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
@@ -1009,14 +1149,201 @@ def parse_zip_file_source_dataset(
     if valid_suffixes is None:
         valid_suffixes = [".xml", ".ilcd"]
 
-    return parse_zip_file(
+    return _parse_zip_file(
         file_path=file_path,
         schema_path=Defaults.SCHEMA_SOURCE_DATASET,
-        lookup=SourceDatasetLookup(),
+        lookup_class=SourceDatasetLookup,
         valid_suffixes=valid_suffixes,
     )
 
 
+def _parse_stream(
+    files: Iterable[Union[str, Path, StringIO]],
+    tag: str,
+    lookup_class: Type[_DatasetLookup],
+    huge_tree: bool = False,
+) -> Iterator[etree.ElementBase]:
+    """Parses the datasets with the given Clark notation root tag from XML files
+    one file at a time. Each file is parsed as a whole, so memory is bounded by the
+    largest file plus the datasets the caller keeps. libxml2's limits on document
+    depth and text size are only lifted if ``huge_tree`` is True."""
+    for file in files:
+        if isinstance(file, Path):
+            file = str(file)
+        context = etree.iterparse(
+            file,
+            events=("end",),
+            tag=tag,
+            remove_blank_text=True,
+            huge_tree=huge_tree,
+        )
+        context.set_element_class_lookup(_get_lookup(lookup_class))
+        for _, dataset in context:
+            yield dataset
+
+
+def parse_stream_process_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[ProcessDataSet]:
+    """Parses ILCD Process Dataset XML files to custom ILCD classes one file at a time,
+    so that a corpus is only held in memory as far as the caller keeps its datasets.
+    The files aren't validated.
+    Parameters:
+    files: the str|Path paths to the ProcessDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over ProcessDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("processDataSet", NAMESPACE_PROCESS_DATASET),
+        ProcessDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_flow_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[FlowDataSet]:
+    """Parses ILCD Flow Dataset XML files to custom ILCD classes one file at a time, so
+    that a corpus is only held in memory as far as the caller keeps its datasets. The
+    files aren't validated.
+    Parameters:
+    files: the str|Path paths to the FlowDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over FlowDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("flowDataSet", NAMESPACE_FLOW_DATASET),
+        FlowDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_flow_property_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[FlowPropertyDataSet]:
+    """Parses ILCD Flow Property Dataset XML files to custom ILCD classes one file at a
+    time, so that a corpus is only held in memory as far as the caller keeps its
+    datasets. The files aren't validated.
+    Parameters:
+    files: the str|Path paths to the FlowPropertyDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over FlowPropertyDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("flowPropertyDataSet", NAMESPACE_FLOW_PROPERTY_DATASET),
+        FlowPropertyDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_unit_group_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[UnitGroupDataSet]:
+    """Parses ILCD Unit Group Dataset XML files to custom ILCD classes one file at a
+    time, so that a corpus is only held in memory as far as the caller keeps its
+    datasets. The files aren't validated.
+    Parameters:
+    files: the str|Path paths to the UnitGroupDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over UnitGroupDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("unitGroupDataSet", NAMESPACE_UNIT_GROUP_DATASET),
+        UnitGroupDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_contact_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[ContactDataSet]:
+    """Parses ILCD Contact Dataset XML files to custom ILCD classes one file at a time,
+    so that a corpus is only held in memory as far as the caller keeps its datasets.
+    The files aren't validated.
+    Parameters:
+    files: the str|Path paths to the ContactDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over ContactDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("contactDataSet", NAMESPACE_CONTACT_DATASET),
+        ContactDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_source_dataset(
+    files: Iterable[Union[str, Path, StringIO]], huge_tree: bool = False
+) -> Iterator[SourceDataSet]:
+    """Parses ILCD Source Dataset XML files to custom ILCD classes one file at a time,
+    so that a corpus is only held in memory as far as the caller keeps its datasets.
+    The files aren't validated.
+    Parameters:
+    files: the str|Path paths to the SourceDataset XML files or their StringIO
+    representations.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over SourceDataset classes representing the roots of the
+    XML files.
+    """
+    return _parse_stream(
+        files,
+        get_tag("sourceDataSet", NAMESPACE_SOURCE_DATASET),
+        SourceDatasetLookup,
+        huge_tree,
+    )
+
+
+def parse_stream_exchanges(
+    file: Union[str, Path, StringIO], huge_tree: bool = False
+) -> Iterator[Exchange]:
+    """Streams the exchanges of an ILCD Process Dataset XML file in a single pass
+    without building the whole tree. Each exchange is cleared, together with the
+    already streamed siblings, once the next one is requested, so read what's
+    needed from it before advancing. The file isn't validated.
+    Parameters:
+    file: the str|Path path to the ProcessDataset XML file or its StringIO
+    representation.
+    huge_tree: whether to lift libxml2's limits on document depth and text size,
+    for trusted files only.
+    Returns an iterator over Exchange classes.
+    """
+    if isinstance(file, Path):
+        file = str(file)
+    context = etree.iterparse(
+        file,
+        events=("end",),
+        tag=get_tag("exchange", NAMESPACE_PROCESS_DATASET),
+        huge_tree=huge_tree,
+    )
+    context.set_element_class_lookup(_get_lookup(ProcessDatasetLookup))
+    for _, exchange in context:
+        yield exchange
+        exchange.clear()
+        while exchange.getprevious() is not None:
+            del exchange.getparent()[0]
+
+
 def save_ilcd_file(
     root: etree.ElementBase, path: str, fill_defaults: bool = False
 ) -> None:
@@ -1036,3 +1363,63 @@ def save_ilcd_file(
     save_file(
         root, path, static_defaults=staticDefaults, dynamic_defaults=dynamicDefaults
     )
+
+
+_REFERENCE_PARSERS: Dict[str, Callable[[Path], etree.ElementBase]] = {
+    "contact data set": parse_file_contact_dataset,
+    "flow data set": parse_file_flow_dataset,
+    "flow property data set": parse_file_flow_property_dataset,
+    "process data set": parse_file_process_dataset,
+    "source data set": parse_file_source_dataset,
+    "unit group data set": parse_file_unit_group_dataset,
+}
+
+
+def resolve_global_reference(
+    reference: GlobalReference, cache: Optional[Dict[Path, etree.ElementBase]] = None
+) -> Optional[etree.ElementBase]:
+    """Parses the ILCD dataset a global reference points to, found through its uri
+    relative to the file of the reference.
+    Parameters:
+    reference: the GlobalReference class to resolve.
+    cache: an optional dict of the datasets already parsed by this function, keyed
+    by their resolved paths. Passing the same dict to several calls resolves
+    references to the same file to the same custom ILCD classes.
+    Returns the referenced dataset as custom ILCD class, or None if the reference
+    can't be resolved to a file of a supported dataset type.
+    """
+    parse = _REFERENCE_PARSERS.get(reference.type)
+    documentUrl = reference.getroottree().docinfo.URL
+    if parse is None or not reference.uri or documentUrl is None:
+        return None
+    path = (Path(documentUrl).parent / reference.uri).resolve()
+    if cache is not None and path in cache:
+        return cache[path]
+    if not path.is_file():
+        return None
+    dataset = parse(path)
+    if cache is not None:
+        cache[path] = dataset
+    return dataset
+
+
+def find_duplicate_datasets(
+    datasets: List[Tuple[Path, etree.ElementBase]]
+) -> Dict[Tuple[str, str], List[Path]]:
+    """Finds ILCD datasets sharing the same UUID and version, e.g. across the
+    results of several parse_directory_* or parse_zip_file_* calls.
+    Parameters:
+    datasets: a list of tuples of file paths and corresponding ILCD classes
+    representing the root of the XML file.
+    Returns a dict mapping each duplicated (UUID, version) pair to the file paths
+    declaring it, which is empty if no duplicates exist. Datasets without a UUID
+    or a version are skipped.
+    """
+    filePaths: Dict[Tuple[str, str], List[Path]] = defaultdict(list)
+    for filePath, root in datasets:
+        uuid = _DATASET_UUID(root)
+        version = _DATASET_VERSION(root)
+        if uuid and version:
+            filePaths[(uuid, version)].append(filePath)
+
+    return {key: paths for key, paths in filePaths.items() if len(paths) > 1}
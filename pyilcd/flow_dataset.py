@@ -3,7 +3,6 @@
 from typing import List
 
 from lxml import etree
-from lxmlh import get_element, get_element_list
 from pycasreg.validation import validate_cas
 
 from .common import (
@@ -17,6 +16,8 @@ from .common import (
 from .helpers import (
     create_attribute_flow_dataset,
     create_attribute_list_flow_dataset,
+    create_element_flow_dataset,
+    create_element_list_flow_dataset,
     create_element_text_flow_dataset,
 )
 
@@ -31,62 +32,54 @@ class FlowDataSet(etree.ElementBase):
     locations = create_attribute_flow_dataset("locations", str)
     """Contains reference to used location table for this dataset."""
 
-    @property
-    def flowInformation(self) -> "FlowInformation":
-        """Covers the INvariable flow information addressed in ISO/TS
-        14048's section "Inputs and outputs" """
-        return get_element(self, "flowInformation")
+    flowInformation: "FlowInformation" = create_element_flow_dataset("flowInformation")
+    """Covers the INvariable flow information addressed in ISO/TS
+    14048's section "Inputs and outputs" """
 
-    @property
-    def modellingAndValidation(self) -> "ModellingAndValidation":
-        """Covers the five sub-sections 1) LCI method, 2) Data sources,
-        treatment and representativeness (not used for flows),
-        3) Completeness (not used for flows), 4) Validation (not
-        used for flows), and 5) Compliance."""
-        return get_element(self, "modellingAndValidation")
+    modellingAndValidation: "ModellingAndValidation" = create_element_flow_dataset(
+        "modellingAndValidation"
+    )
+    """Covers the five sub-sections 1) LCI method, 2) Data sources,
+    treatment and representativeness (not used for flows),
+    3) Completeness (not used for flows), 4) Validation (not
+    used for flows), and 5) Compliance."""
 
-    @property
-    def administrativeInformation(self) -> "AdministrativeInformation":
-        """Information on data set management and administration."""
-        return get_element(self, "administrativeInformation")
+    administrativeInformation: "AdministrativeInformation" = (
+        create_element_flow_dataset("administrativeInformation")
+    )
+    """Information on data set management and administration."""
 
-    @property
-    def flowProperties(self) -> "FlowProperties":
-        """List of flow properties (with all variable information
-        linked to that respective flow)."""
-        return get_element(self, "flowProperties")
+    flowProperties: "FlowProperties" = create_element_flow_dataset("flowProperties")
+    """List of flow properties (with all variable information
+    linked to that respective flow)."""
 
 
 class FlowInformation(etree.ElementBase):
     """Covers the INvariable flow information addressed in ISO/TS
     14048's section "Inputs and outputs" """
 
-    @property
-    def dataSetInformation(self) -> "DataSetInformation":
-        """General data set information. Covers the ISO/TS 14048 fields
-        1.2.1, 1.2.3, 1.2.4, 1.2.5, (1.2.6), (1.2.7),1.2.10.1, 1.2.10.2,
-        1.2.10.3, and references to 1.2.11 (Flow property) and 1.2.11.2
-        (Unit)."""
-        return get_element(self, "dataSetInformation")
-
-    @property
-    def quantitativeReference(self) -> "QuantitativeReference":
-        """This section names the type of quantitative reference used for
-        this Flow data set, which is always one of the Flow's Flow
-        properties (see section "Flow properties")."""
-        return get_element(self, "quantitativeReference")
-
-    @property
-    def geography(self) -> "Geography":
-        """Provides information about the geographical representativeness
-        of the data set."""
-        return get_element(self, "geography")
-
-    @property
-    def technology(self) -> "Technology":
-        """Provides information about the technological representativeness
-        of the flow in case it is a product or waste flow."""
-        return get_element(self, "technology")
+    dataSetInformation: "DataSetInformation" = create_element_flow_dataset(
+        "dataSetInformation"
+    )
+    """General data set information. Covers the ISO/TS 14048 fields
+    1.2.1, 1.2.3, 1.2.4, 1.2.5, (1.2.6), (1.2.7),1.2.10.1, 1.2.10.2,
+    1.2.10.3, and references to 1.2.11 (Flow property) and 1.2.11.2
+    (Unit)."""
+
+    quantitativeReference: "QuantitativeReference" = create_element_flow_dataset(
+        "quantitativeReference"
+    )
+    """This section names the type of quantitative reference used for
+    this Flow data set, which is always one of the Flow's Flow
+    properties (see section "Flow properties")."""
+
+    geography: "Geography" = create_element_flow_dataset("geography")
+    """Provides information about the geographical representativeness
+    of the data set."""
+
+    technology: "Technology" = create_element_flow_dataset("technology")
+    """Provides information about the technological representativeness
+    of the flow in case it is a product or waste flow."""
 
 
 class ModellingAndValidation(etree.ElementBase):
@@ -95,45 +88,41 @@ class ModellingAndValidation(etree.ElementBase):
     3) Completeness (not used for flows), 4) Validation (not
     used for flows), and 5) Compliance."""
 
-    @property
-    def lciMethod(self) -> "LCIMethod":
-        """LCI methodological modelling aspects."""
-        return get_element(self, "LCIMethod")
+    lciMethod: "LCIMethod" = create_element_flow_dataset("LCIMethod")
+    """LCI methodological modelling aspects."""
 
-    @property
-    def complianceDeclarations(self) -> "ComplianceDeclarations":
-        """Statements on compliance of several data set aspects with compliance
-        requirements as defined by the referenced compliance system (e.g. an
-        EPD scheme, handbook of a national or international data network such
-        as the ILCD, etc.)."""
-        return get_element(self, "complianceDeclarations")
+    complianceDeclarations: "ComplianceDeclarations" = create_element_flow_dataset(
+        "complianceDeclarations"
+    )
+    """Statements on compliance of several data set aspects with compliance
+    requirements as defined by the referenced compliance system (e.g. an
+    EPD scheme, handbook of a national or international data network such
+    as the ILCD, etc.)."""
 
 
 class AdministrativeInformation(etree.ElementBase):
     """Information on data set management and administration."""
 
-    @property
-    def dataEntryBy(self) -> "DataEntryBy":
-        """Staff or entity, that documented the generated data set, entering
-        the information into the database; plus administrative information
-        linked to the data entry activity.."""
-        return get_element(self, "dataEntryBy")
+    dataEntryBy: "DataEntryBy" = create_element_flow_dataset("dataEntryBy")
+    """Staff or entity, that documented the generated data set, entering
+    the information into the database; plus administrative information
+    linked to the data entry activity.."""
 
-    @property
-    def publicationAndOwnership(self) -> "PublicationAndOwnership":
-        """Information related to publication and version management of the
-        data set including copyright and access restrictions."""
-        return get_element(self, "publicationAndOwnership")
+    publicationAndOwnership: "PublicationAndOwnership" = create_element_flow_dataset(
+        "publicationAndOwnership"
+    )
+    """Information related to publication and version management of the
+    data set including copyright and access restrictions."""
 
 
 class FlowProperties(etree.ElementBase):
     """List of flow properties (with all variable information
     linked to that respective flow)."""
 
-    @property
-    def flowProperties(self) -> List["FlowProperty"]:
-        """One flow property."""
-        return get_element_list(self, "flowProperty")
+    flowProperties: List["FlowProperty"] = create_element_list_flow_dataset(
+        "flowProperty"
+    )
+    """One flow property."""
 
 
 class DataSetInformation(etree.ElementBase):
@@ -142,7 +131,7 @@ class DataSetInformation(etree.ElementBase):
     1.2.10.3, and references to 1.2.11 (Flow property) and 1.2.11.2
     (Unit)."""
 
-    commonUUID = create_attribute_flow_dataset("common:UUID", str)
+    commonUUID = create_element_text_flow_dataset("common:UUID", str)
     """Automatically generated Universally Unique Identifier of this data
     set. Together with the "Data set version", the UUID uniquely identifies each data
     set."""
@@ -165,18 +154,16 @@ class DataSetInformation(etree.ElementBase):
     a specific technology or industry-context, information sources used, data
     selection principles etc."""
 
-    @property
-    def name(self) -> "Name":
-        """General descriptive and specifying name of the flow."""
-        return get_element(self, "name")
+    name: "Name" = create_element_flow_dataset("name")
+    """General descriptive and specifying name of the flow."""
 
-    @property
-    def classificationInformation(self) -> "FlowCategoryInformation":
-        """Hierarchical classification of the good, service, or process.
-        (Note: This entry is NOT required for the identification of a Process. It should
-        nevertheless be avoided to use identical names for Processes in the same
-        category."""
-        return get_element(self, "classificationInformation")
+    classificationInformation: "FlowCategoryInformation" = create_element_flow_dataset(
+        "classificationInformation"
+    )
+    """Hierarchical classification of the good, service, or process.
+    (Note: This entry is NOT required for the identification of a Process. It should
+    nevertheless be avoided to use identical names for Processes in the same
+    category."""
 
 
 class QuantitativeReference(etree.ElementBase):
@@ -184,6 +171,8 @@ class QuantitativeReference(etree.ElementBase):
     this Flow data set, which is always one of the Flow's Flow
     properties (see section "Flow properties")."""
 
+    __slots__ = ()
+
     referenceToReferenceFlowProperty = create_element_text_flow_dataset(
         "referenceToReferenceFlowProperty", int
     )
@@ -197,6 +186,8 @@ class Geography(etree.ElementBase):
     """Provides information about the geographical representativeness
     of the data set."""
 
+    __slots__ = ()
+
     locationOfSupply = create_attribute_list_flow_dataset("locationOfSupply", str)
     """Only used for product or waste flows and only required for
     matrix-type databases. Location or region of supply / consumption
@@ -226,16 +217,18 @@ class Technology(etree.ElementBase):
     composted or biodigested as the water content is too high for
     efficient combustion"."""
 
-    @property
-    def referenceToTechnicalSpecification(self) -> List["GlobalReference"]:
-        """ "Source data set(s)" of the product's or waste's technical
-        specification, waste data sheet, safety data sheet, etc."""
-        return get_element_list(self, "referenceToTechnicalSpecification")
+    referenceToTechnicalSpecification: List["GlobalReference"] = (
+        create_element_list_flow_dataset("referenceToTechnicalSpecification")
+    )
+    """ "Source data set(s)" of the product's or waste's technical
+    specification, waste data sheet, safety data sheet, etc."""
 
 
 class LCIMethod(etree.ElementBase):
     """LCI methodological modelling aspects."""
 
+    __slots__ = ()
+
     typeOfDataSet = create_element_text_flow_dataset("typeOfDataSet", str)
     """Names the basic type of the flow."""
 
@@ -250,11 +243,11 @@ class PublicationAndOwnership(PublicationAndOwnershipGroup1):
     """Information related to publication and version management of the
     data set including copyright and access restrictions."""
 
-    @property
-    def referenceToOwnershipOfDataSet(self) -> "GlobalReference":
-        """ "Contact data set" of the person or entity who owns this data set.
-        (Note: this is not necessarily the publisher of the data set.)"""
-        return get_element(self, "common:referenceToOwnershipOfDataSet")
+    referenceToOwnershipOfDataSet: "GlobalReference" = create_element_flow_dataset(
+        "common:referenceToOwnershipOfDataSet"
+    )
+    """ "Contact data set" of the person or entity who owns this data set.
+    (Note: this is not necessarily the publisher of the data set.)"""
 
 
 class FlowProperty(etree.ElementBase):
@@ -316,15 +309,17 @@ class FlowProperty(etree.ElementBase):
     to specifc data sources used, or for workflow purposes about status of
     "finalisation" of an entry etc."""
 
-    @property
-    def referenceToFlowPropertyDataSet(self) -> "GlobalReference":
-        """ "Flow property data set."""
-        return get_element(self, "referenceToFlowPropertyDataSet")
+    referenceToFlowPropertyDataSet: "GlobalReference" = create_element_flow_dataset(
+        "referenceToFlowPropertyDataSet"
+    )
+    """ "Flow property data set."""
 
 
 class Name(etree.ElementBase):
     """General descriptive and specifying name of the flow."""
 
+    __slots__ = ()
+
     baseName = create_attribute_list_flow_dataset("baseName", str)
     """General descriptive name of the elementary, waste or product flow,
     for the latter including it's level of processing."""
@@ -1,11 +1,544 @@
 """Internal helper classes."""
 
-from typing import Callable, Optional
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from lxmlh import create_attribute, create_attribute_list, create_element_text
+import lxmlh
+from lxml import etree
+from lxmlh import TYPE_DEFAULTS, TYPE_FUNC_MAP
 
 from .config import Defaults
 
+NAMESPACE_COMMON = "http://lca.jrc.it/ILCD/Common"
+NAMESPACE_PROCESS_DATASET = "http://lca.jrc.it/ILCD/Process"
+NAMESPACE_FLOW_DATASET = "http://lca.jrc.it/ILCD/Flow"
+NAMESPACE_FLOW_PROPERTY_DATASET = "http://lca.jrc.it/ILCD/FlowProperty"
+NAMESPACE_UNIT_GROUP_DATASET = "http://lca.jrc.it/ILCD/UnitGroup"
+NAMESPACE_CONTACT_DATASET = "http://lca.jrc.it/ILCD/Contact"
+NAMESPACE_SOURCE_DATASET = "http://lca.jrc.it/ILCD/Source"
+
+_QNAME_CACHE: Dict[Tuple[str, str], str] = {}
+_LOCAL_NAMES: Dict[str, str] = {}
+_TEXT_XPATHS: Dict[str, etree.XPath] = {}
+
+
+def parse_boolean(value: str) -> bool:
+    """Helper method for converting an xs:boolean attribute or element text, which
+    may be surrounded by whitespace, to bool."""
+    return value.strip().lower() in ("true", "1")
+
+
+CONVERTERS: Dict[type, Callable[[str], Any]] = {**TYPE_FUNC_MAP, bool: parse_boolean}
+"""Type converters applied by the pre-bound getters of attributes and element
+texts, with ``bool`` covering the whole xs:boolean lexical space."""
+
+FIELD_ELEMENT = 0
+FIELD_TEXT = 1
+FIELD_TEXT_LIST = 2
+
+
+def create_tag(name: str, namespace: str) -> str:
+    """Helper method for building the Clark notation ``{namespace}name`` of an
+    ilcd element tag once, so that lookups don't resolve prefixes on each access.
+    Names prefixed with ``common:`` are resolved to the ilcd common namespace and
+    names already in Clark notation are returned as they are. Tags are interned so
+    that all descriptors of the same tag share one string."""
+    if name.startswith("{"):
+        return sys.intern(name)
+    prefix, _, localName = name.rpartition(":")
+    if prefix == "common":
+        namespace = NAMESPACE_COMMON
+    return sys.intern(f"{{{namespace}}}{localName}")
+
+
+def get_tag(name: str, namespace: str) -> str:
+    """Helper method for retrieving the Clark notation of an ilcd element tag,
+    built on first use and cached afterwards."""
+    try:
+        return _QNAME_CACHE[(namespace, name)]
+    except KeyError:
+        tag = _QNAME_CACHE[(namespace, name)] = create_tag(name, namespace)
+        return tag
+
+
+def create_children_reader(
+    namespace: str, fields: Sequence[Tuple[str, int, type]]
+) -> Callable[[etree.ElementBase], List[Any]]:
+    """Helper method for creating a reader which collects several child fields of
+    an ilcd element in a single walk over its children. Each field is a
+    ``(name, kind, type)`` triple where kind is FIELD_ELEMENT (first child element),
+    FIELD_TEXT (first child text) or FIELD_TEXT_LIST (all child texts). Values match
+    the ones of the corresponding element, element text and element text list
+    properties. Returns the values in the order of the fields."""
+    slots = {
+        create_tag(name, namespace): (
+            index,
+            kind,
+            CONVERTERS.get(fieldType, fieldType),
+        )
+        for index, (name, kind, fieldType) in enumerate(fields)
+    }
+    missing = object()
+
+    def reader(parent: etree.ElementBase) -> List[Any]:
+        values = [[] if kind == FIELD_TEXT_LIST else missing for _, kind, _ in fields]
+        for child in parent.iterchildren(*slots):
+            index, kind, convert = slots[child.tag]
+            if kind == FIELD_TEXT_LIST:
+                text = child.text
+                if convert not in (int, float):
+                    text = re.sub("[\n]{1,}", " ", re.sub("[ ]{2,}", "", text))
+                values[index].append(convert(text))
+            elif values[index] is missing:
+                values[index] = child if kind == FIELD_ELEMENT else convert(child.text)
+        for index, (_, kind, fieldType) in enumerate(fields):
+            if values[index] is missing:
+                values[index] = (
+                    None
+                    if kind == FIELD_ELEMENT
+                    else CONVERTERS.get(fieldType, fieldType)(TYPE_DEFAULTS[str])
+                )
+        return values
+
+    return reader
+
+
+def element_to_dict(element: etree.ElementBase) -> Dict[str, Any]:
+    """Helper method for reading an ilcd element into a dict in a single walk over
+    its subtree. Keys are the local names of attributes and child elements. Leaf
+    elements without attributes map to their text, other elements to nested dicts
+    (with the text of leaves under "text"), and repeated child elements to lists."""
+    value = _element_value(element)
+    return value if isinstance(value, dict) else {"text": value}
+
+
+def _element_value(element: etree.ElementBase) -> Any:
+    attributes = element.attrib
+    children = list(element.iterchildren(etree.Element))
+    if not children and not attributes:
+        return element.text
+    value: Dict[str, Any] = {
+        _get_local_name(key): attribute for key, attribute in attributes.items()
+    }
+    if not children:
+        if element.text is not None:
+            value["text"] = element.text
+        return value
+    repeated = set()
+    for child in children:
+        key = _get_local_name(child.tag)
+        childValue = _element_value(child)
+        if key not in value:
+            value[key] = childValue
+        elif key in repeated:
+            value[key].append(childValue)
+        else:
+            value[key] = [value[key], childValue]
+            repeated.add(key)
+    return value
+
+
+def _get_local_name(tag: str) -> str:
+    try:
+        return _LOCAL_NAMES[tag]
+    except KeyError:
+        localName = _LOCAL_NAMES[tag] = tag.rpartition("}")[2]
+        return localName
+
+
+class ChildElement:
+    """Descriptor retrieving the first ilcd child element with one of the given
+    Clark notation tags as custom XML class. The children are searched on each
+    access, so that edits of the tree such as a sibling with the same tag inserted
+    in front are followed. For classes whose instances have a ``__dict__``, the
+    element found is kept there, so that its Python proxy lives as long as the one
+    of the instance and isn't rebuilt by lxml on the next access."""
+
+    __slots__ = ("tags", "name", "memoize")
+
+    def __init__(self, *tags: str) -> None:
+        self.tags = tags
+        self.name = ""
+        self.memoize = False
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.memoize = owner.__dictoffset__ != 0
+
+    def lookup(self, parent: etree.ElementBase) -> Any:
+        """Retrieves the child element of the parent."""
+        return next(parent.iterchildren(*self.tags), None)
+
+    def __get__(self, instance: Optional[etree.ElementBase], owner: type) -> Any:
+        if instance is None:
+            return self
+        value = self.lookup(instance)
+        if self.memoize:
+            if value is None:
+                instance.__dict__.pop(self.name, None)
+            else:
+                instance.__dict__[self.name] = value
+        return value
+
+    def __set__(self, instance: etree.ElementBase, value: Any) -> None:
+        raise AttributeError(f"can't set attribute '{self.name}'")
+
+
+class ChildElementList(ChildElement):
+    """Descriptor retrieving all ilcd child elements with one of the given Clark
+    notation tags as a list of custom XML classes. The list is built on each
+    access, as a memoized list would miss children added or removed later."""
+
+    __slots__ = ()
+
+    def __get__(self, instance: Optional[etree.ElementBase], owner: type) -> Any:
+        if instance is None:
+            return self
+        return self.lookup(instance)
+
+    def lookup(self, parent: etree.ElementBase) -> Any:
+        """Retrieves the list of child elements of the parent."""
+        return list(parent.iterchildren(*self.tags))
+
+
+class ChildElementAt(ChildElement):
+    """Descriptor retrieving the ilcd child element with a given Clark notation tag
+    which the schema places at a fixed position among its siblings. The child at
+    that position is checked first; documents with the element elsewhere (e.g.
+    after a comment) fall back to searching the children."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, tag: str, index: int) -> None:
+        super().__init__(tag)
+        self.index = index
+
+    def lookup(self, parent: etree.ElementBase) -> Any:
+        """Retrieves the child element of the parent."""
+        if len(parent) > self.index:
+            child = parent[self.index]
+            if child.tag in self.tags:
+                return child
+        return super().lookup(parent)
+
+
+def create_element_process_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Process Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_PROCESS_DATASET))
+
+
+def create_element_at_process_dataset(name: str, index: int) -> ChildElementAt:
+    """Helper wrapper method for creating a getter for an ilcd Process Dataset
+    child element at a fixed position"""
+    return ChildElementAt(get_tag(name, NAMESPACE_PROCESS_DATASET), index)
+
+
+def create_element_list_process_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Process Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_PROCESS_DATASET))
+
+
+def iter_elements_process_dataset(
+    parent: etree.ElementBase, name: str
+) -> Iterator[etree.ElementBase]:
+    """Helper wrapper method for lazily iterating over ilcd Process Dataset
+    child elements as custom XML classes."""
+    return parent.iterchildren(get_tag(name, NAMESPACE_PROCESS_DATASET))
+
+
+def create_element_common(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Common
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_COMMON))
+
+
+def create_element_list_common(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Common
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_COMMON))
+
+
+def create_element_flow_property_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Flow Property Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_FLOW_PROPERTY_DATASET))
+
+
+def create_element_list_flow_property_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Flow Property Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_FLOW_PROPERTY_DATASET))
+
+
+def create_element_flow_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Flow Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_FLOW_DATASET))
+
+
+def create_element_list_flow_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Flow Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_FLOW_DATASET))
+
+
+def create_element_unit_group_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Unit Group Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_UNIT_GROUP_DATASET))
+
+
+def create_element_list_unit_group_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Unit Group Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_UNIT_GROUP_DATASET))
+
+
+def create_element_contact_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Contact Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_CONTACT_DATASET))
+
+
+def create_element_list_contact_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Contact Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_CONTACT_DATASET))
+
+
+def create_element_source_dataset(name: str) -> ChildElement:
+    """Helper wrapper method for creating a getter for an ilcd Source Dataset
+    child element"""
+    return ChildElement(get_tag(name, NAMESPACE_SOURCE_DATASET))
+
+
+def create_element_list_source_dataset(name: str) -> ChildElementList:
+    """Helper wrapper method for creating a getter for an ilcd Source Dataset
+    child element list"""
+    return ChildElementList(get_tag(name, NAMESPACE_SOURCE_DATASET))
+
+
+def create_attribute_getter(
+    name: str, attr_type: type
+) -> Callable[[etree.ElementBase], Any]:
+    """Helper method for creating an ilcd attribute getter with the name, the
+    default and the type converter bound once as locals instead of being looked
+    up on each access. Returns TYPE_DEFAULTS[type] if the attribute doesn't exist."""
+
+    def getter(
+        self: etree.ElementBase,
+        _get: Callable = etree._Element.get,
+        _name: str = sys.intern(name),
+        _default: Any = TYPE_DEFAULTS.get(attr_type, None),
+        _convert: Callable = CONVERTERS.get(attr_type, attr_type),
+    ) -> Any:
+        return _convert(_get(self, _name, _default))
+
+    return getter
+
+
+def get_text_xpath(tag: str) -> etree.XPath:
+    """Helper method for retrieving the compiled XPath selecting the texts of the
+    ilcd child elements with a given Clark notation tag, built on first use and
+    shared by all getters of the same tag afterwards."""
+    try:
+        return _TEXT_XPATHS[tag]
+    except KeyError:
+        tagNamespace, _, localName = tag[1:].partition("}")
+        xpath = _TEXT_XPATHS[tag] = etree.XPath(
+            f"tns:{localName}/text()",
+            namespaces={"tns": tagNamespace},
+            smart_strings=False,
+        )
+        return xpath
+
+
+def create_element_text_getter(
+    name: str, element_type: type, namespace: str
+) -> Callable[[etree.ElementBase], Any]:
+    """Helper method for creating an ilcd element text getter backed by an XPath
+    compiled once, which returns the text without creating a proxy for the
+    element. Returns the converted TYPE_DEFAULTS[str] if the element doesn't exist
+    or has no text."""
+
+    def getter(
+        self: etree.ElementBase,
+        _xpath: etree.XPath = get_text_xpath(get_tag(name, namespace)),
+        _default: str = TYPE_DEFAULTS[str],
+        _convert: Callable = CONVERTERS.get(element_type, element_type),
+    ) -> Any:
+        texts = _xpath(self)
+        return _convert(texts[0] if texts else _default)
+
+    return getter
+
+
+def create_number_list_getter(
+    name: str, attr_type: type, namespace: str
+) -> Callable[[etree.ElementBase], List[Any]]:
+    """Helper method for creating an ilcd numeric element text list getter which
+    converts all texts in a single ``map`` call. Returns empty list if elements
+    don't exist."""
+
+    def getter(
+        self: etree.ElementBase,
+        _tag: str = get_tag(name, namespace),
+        _convert: Callable = attr_type,
+    ) -> List[Any]:
+        return list(map(_convert, [child.text for child in self.iterchildren(_tag)]))
+
+    return getter
+
+
+class SchemaResolver(etree.Resolver):
+    """Resolves the remote schemas imported by the ILCD schemas to their copies
+    bundled with pyilcd, so that compiling them never touches the network."""
+
+    BUNDLED_SCHEMAS: Dict[str, str] = {
+        "http://www.w3.org/2001/xml.xsd": Defaults.SCHEMA_XML,
+    }
+
+    def resolve(self, system_url, public_id, context):
+        localPath = self.BUNDLED_SCHEMAS.get(system_url)
+        if localPath is None:
+            return None
+        return self.resolve_filename(localPath, context)
+
+
+@lru_cache(maxsize=None)
+def get_schema(schema_path: str) -> etree.XMLSchema:
+    """Compiles an XSD schema once per path, as compiling the ILCD schemas costs
+    several times more than parsing a dataset with them."""
+    parser = etree.XMLParser()
+    parser.resolvers.add(SchemaResolver())
+    return etree.XMLSchema(etree.parse(schema_path, parser))
+
+
+def set_attribute(
+    element: etree.ElementBase,
+    key: str,
+    value: Any,
+    schema_file: str,
+    validator: Optional[Callable] = None,
+) -> None:
+    """Helper method for setting an ilcd attribute, like lxmlh.set_attribute but
+    validating against the compiled schema of get_schema. Raises DocumentInvalid
+    exception on inappropriate setting according to XSD schema."""
+    if validator is not None:
+        value = validator(value)
+    element.set(key, str(value))
+    get_schema(schema_file).assertValid(element.getroottree())
+
+
+def set_attribute_list(
+    element: etree.ElementBase, key: str, values: List[Any], schema_file: str
+) -> None:
+    """Helper method for setting an ilcd element text list, like
+    lxmlh.set_attribute_list but validating against the compiled schema of
+    get_schema. The new elements take the place of the old ones. Raises
+    DocumentInvalid exception on inappropriate setting according to XSD schema."""
+    oldValues = element.findall(key, namespaces=element.nsmap)
+    index = element.index(oldValues[0]) if oldValues else len(element)
+    for oldValue in oldValues:
+        element.remove(oldValue)
+    tag = create_tag(key, element.nsmap.get(None, ""))
+    for offset, value in enumerate(values):
+        child = element.makeelement(tag)
+        child.text = str(value)
+        element.insert(index + offset, child)
+    get_schema(schema_file).assertValid(element.getroottree())
+
+
+def set_element_text(
+    parent: etree.ElementBase, name: str, value: Any, schema_file: str
+) -> None:
+    """Helper method for setting an ilcd element text, like lxmlh.set_element_text
+    but validating against the compiled schema of get_schema. Raises
+    DocumentInvalid exception on inappropriate setting according to XSD schema."""
+    parent.find(name, namespaces=parent.nsmap).text = str(value)
+    get_schema(schema_file).assertValid(parent.getroottree())
+
+
+def create_attribute(
+    name: str, attr_type: type, schema_file: str, validator: Optional[Callable] = None
+) -> property:
+    """Helper method for creating setters and getters for an ilcd attribute, with
+    a pre-bound getter."""
+    return property(
+        fget=create_attribute_getter(name, attr_type),
+        fset=lambda self, value: set_attribute(
+            self, name, value, schema_file, validator
+        ),
+    )
+
+
+def create_attribute_list(name: str, attr_type: type, schema_file: str) -> property:
+    """Helper method for creating setters and getters for an ilcd element text
+    list, with the lxmlh getter."""
+    return lxmlh.create_attribute_list(name, attr_type, schema_file).setter(
+        lambda self, values: set_attribute_list(self, name, values, schema_file)
+    )
+
+
+def create_element_text(name: str, element_type: type, schema_file: str) -> property:
+    """Helper method for creating setters and getters for an ilcd element text,
+    with the lxmlh getter."""
+    return lxmlh.create_element_text(name, element_type, schema_file).setter(
+        lambda self, value: set_element_text(self, name, value, schema_file)
+    )
+
+
+def create_bound_attribute_list(
+    name: str, attr_type: type, schema_file: str, namespace: str
+) -> property:
+    """Helper method for creating setters and getters for an ilcd element text
+    list, with a pre-bound getter for numeric lists."""
+    attributeList = create_attribute_list(name, attr_type, schema_file)
+    if attr_type in (int, float):
+        return attributeList.getter(
+            create_number_list_getter(name, attr_type, namespace)
+        )
+    return attributeList
+
+
+def parse_latitude_and_longitude(value: str) -> Optional[Tuple[float, float]]:
+    """Helper method for decoding an ilcd GIS ``"latitude;longitude"`` value into a
+    pair of floats. Returns None if the value is empty."""
+    latitude, separator, longitude = value.partition(";")
+    if not separator:
+        return None
+    return float(latitude), float(longitude)
+
+
+def create_text_list_getter(
+    name: str, namespace: str
+) -> Callable[[etree.ElementBase], List[str]]:
+    """Helper method for creating an ilcd element text list getter with the Clark
+    notation tag bound once, which walks the children without an ElementPath
+    search. Returns empty list if elements don't exist."""
+
+    def getter(
+        self: etree.ElementBase, _tag: str = get_tag(name, namespace)
+    ) -> List[str]:
+        return [
+            re.sub("[\n]{1,}", " ", re.sub("[ ]{2,}", "", child.text))
+            for child in self.iterchildren(_tag)
+        ]
+
+    return getter
+
+
+def create_text_list_process_dataset(name: str) -> property:
+    """Helper wrapper method for creating setters and getters for an ilcd
+    Process Dataset element text list"""
+    return create_attribute_list(name, str, Defaults.SCHEMA_PROCESS_DATASET).getter(
+        create_text_list_getter(name, NAMESPACE_PROCESS_DATASET)
+    )
+
 
 def create_attribute_process_dataset(
     name: str, attr_type: type, validator: Optional[Callable] = None
@@ -62,7 +595,9 @@ def create_attribute_source_dataset(
 def create_element_text_process_dataset(name: str, element_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Process Dataset element text"""
-    return create_element_text(name, element_type, Defaults.SCHEMA_PROCESS_DATASET)
+    return create_element_text(
+        name, element_type, Defaults.SCHEMA_PROCESS_DATASET
+    ).getter(create_element_text_getter(name, element_type, NAMESPACE_PROCESS_DATASET))
 
 
 def create_element_text_flow_dataset(name: str, element_type: type) -> property:
@@ -71,6 +606,16 @@ def create_element_text_flow_dataset(name: str, element_type: type) -> property:
     return create_element_text(name, element_type, Defaults.SCHEMA_FLOW_DATASET)
 
 
+def create_element_text_flow_property_dataset(
+    name: str, element_type: type
+) -> property:
+    """Helper wrapper method for creating setters and getters for an ilcd
+    Flow Property element text"""
+    return create_element_text(
+        name, element_type, Defaults.SCHEMA_FLOW_PROPERTY_DATASET
+    )
+
+
 def create_element_text_unit_group_dataset(name: str, element_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Unit Group element text"""
@@ -83,37 +628,61 @@ def create_element_text_contact_dataset(name: str, element_type: type) -> proper
     return create_element_text(name, element_type, Defaults.SCHEMA_CONTACT_DATASET)
 
 
+def create_element_text_source_dataset(name: str, element_type: type) -> property:
+    """Helper wrapper method for creating setters and getters for an ilcd
+    Source element text"""
+    return create_element_text(name, element_type, Defaults.SCHEMA_SOURCE_DATASET)
+
+
 def create_attribute_list_process_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Process Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_PROCESS_DATASET)
+    return create_bound_attribute_list(
+        name, attr_type, Defaults.SCHEMA_PROCESS_DATASET, NAMESPACE_PROCESS_DATASET
+    )
 
 
 def create_attribute_list_flow_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Flow Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_FLOW_DATASET)
+    return create_bound_attribute_list(
+        name, attr_type, Defaults.SCHEMA_FLOW_DATASET, NAMESPACE_FLOW_DATASET
+    )
 
 
 def create_attribute_list_flow_property_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Flow Property Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_FLOW_PROPERTY_DATASET)
+    return create_bound_attribute_list(
+        name,
+        attr_type,
+        Defaults.SCHEMA_FLOW_PROPERTY_DATASET,
+        NAMESPACE_FLOW_PROPERTY_DATASET,
+    )
 
 
 def create_attribute_list_unit_group_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Unit Group Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_UNIT_GROUP_DATASET)
+    return create_bound_attribute_list(
+        name,
+        attr_type,
+        Defaults.SCHEMA_UNIT_GROUP_DATASET,
+        NAMESPACE_UNIT_GROUP_DATASET,
+    )
 
 
 def create_attribute_list_contact_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Contact Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_CONTACT_DATASET)
+    return create_bound_attribute_list(
+        name, attr_type, Defaults.SCHEMA_CONTACT_DATASET, NAMESPACE_CONTACT_DATASET
+    )
 
 
 def create_attribute_list_source_dataset(name: str, attr_type: type) -> property:
     """Helper wrapper method for creating setters and getters for an ilcd
     Source Dataset element text list"""
-    return create_attribute_list(name, attr_type, Defaults.SCHEMA_SOURCE_DATASET)
+    return create_bound_attribute_list(
+        name, attr_type, Defaults.SCHEMA_SOURCE_DATASET, NAMESPACE_SOURCE_DATASET
+    )
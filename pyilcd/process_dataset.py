@@ -1,12 +1,16 @@
-"""Custom ILCD Python classes for ProcessDataSet of ILCD schema."""
+"""Custom ILCD Python classes for ProcessDataSet of ILCD schema.
 
-from typing import List
+Child elements are retrieved through shared ``ChildElement`` descriptors and, for
+classes with an instance ``__dict__``, kept there for as long as the Python proxy of
+the element lives, so that their proxies aren't rebuilt on each access."""
+
+from math import nan
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from lxml import etree
-from lxmlh import get_element, get_element_list
 
+from .common import CommissionerAndGoal  # noqa: F401 (re-exported)
 from .common import (
-    CommissionerAndGoal,
     ComplianceGroup,
     DataEntryByGroup1,
     DataEntryByGroup2,
@@ -19,10 +23,81 @@ from .common import (
     ValidationGroup3,
 )
 from .helpers import (
+    FIELD_ELEMENT,
+    FIELD_TEXT,
+    FIELD_TEXT_LIST,
+    NAMESPACE_PROCESS_DATASET,
     create_attribute_list_process_dataset,
     create_attribute_process_dataset,
+    create_children_reader,
+    create_element_at_process_dataset,
+    create_element_list_process_dataset,
+    create_element_process_dataset,
     create_element_text_process_dataset,
+    create_text_list_process_dataset,
+    element_to_dict,
+    iter_elements_process_dataset,
+    parse_latitude_and_longitude,
+)
+from .validators import validate_latitude_and_longitude
+
+_READ_DATA_SET_INFORMATION = create_children_reader(
+    NAMESPACE_PROCESS_DATASET,
+    (
+        ("common:synonyms", FIELD_TEXT_LIST, str),
+        ("common:generalComment", FIELD_TEXT_LIST, str),
+        ("name", FIELD_ELEMENT, object),
+        ("complementingProcesses", FIELD_ELEMENT, object),
+        ("classificationInformation", FIELD_ELEMENT, object),
+        ("referenceToExternalDocumentation", FIELD_ELEMENT, object),
+    ),
 )
+_READ_TIME = create_children_reader(
+    NAMESPACE_PROCESS_DATASET,
+    (
+        ("common:referenceYear", FIELD_TEXT, int),
+        ("common:dataSetValidUntil", FIELD_TEXT, int),
+        ("common:timeRepresentativenessDescription", FIELD_TEXT_LIST, str),
+    ),
+)
+
+_EXCHANGE_AMOUNTS = (
+    "meanAmount",
+    "resultingAmount",
+    "minimumAmount",
+    "maximumAmount",
+    "relativeStandardDeviation95In",
+)
+# Reads the first text of each amount of an exchange joined by "|" in one XPath
+# evaluation, without creating proxies for the amount elements.
+_READ_EXCHANGE_AMOUNTS = etree.XPath(
+    "concat({})".format(
+        ",'|',".join(f"string(tns:{name})" for name in _EXCHANGE_AMOUNTS)
+    ),
+    namespaces={"tns": NAMESPACE_PROCESS_DATASET},
+    smart_strings=False,
+)
+
+
+class DataSetInformationTuple(NamedTuple):
+    """Fields of a DataSetInformation read at once."""
+
+    commonUUID: str
+    identifierOfSubDataSet: str
+    synonyms: List[str]
+    generalComments: List[str]
+    name: "Name"
+    complementingProcesses: "ComplementingProcesses"
+    classificationInformation: "FlowCategoryInformation"
+    referenceToExternalDocumentation: "GlobalReference"
+
+
+class TimeTuple(NamedTuple):
+    """Fields of a Time read at once."""
+
+    referenceYear: int
+    dataSetValidUntil: int
+    timeRepresentativenessDescription: List[str]
 
 
 class ProcessDataSet(etree.ElementBase):
@@ -39,41 +114,43 @@ class ProcessDataSet(etree.ElementBase):
     """Indicates whether this data set contains only meta data (no exchanges
     section)."""
 
-    @property
-    def processInformation(self) -> "ProcessInformation":
-        """Corresponds to the ISO/TS 14048 section "Process description". It
-        comprises the following six sub-sections: 1) "Data set information" for
-        data set identification and overarching information items, 2) "Quantitative
-        reference", 3) "Time", 4) "Geography", 5) "Technology" and 6) "Mathematical
-        relations"."""
-        return get_element(self, "processInformation")
+    processInformation: "ProcessInformation" = create_element_at_process_dataset(
+        "processInformation", 0
+    )
+    """Corresponds to the ISO/TS 14048 section "Process description". It
+    comprises the following six sub-sections: 1) "Data set information" for
+    data set identification and overarching information items, 2) "Quantitative
+    reference", 3) "Time", 4) "Geography", 5) "Technology" and 6) "Mathematical
+    relations"."""
 
-    @property
-    def modellingAndValidation(self) -> "ModellingAndValidation":
-        """Covers the five sub-sections 1) LCI method and allocation, 2) Data
-        sources, treatment and representativeness, 3) Completeness, 4) Validation,
-        and 5) Compliance. (Section refers to LCI modelling and data treatment
-        aspects etc., NOT the modeling of e.g. the input/output-relationships of a
-        parameterised data set.)"""
-        return get_element(self, "modellingAndValidation")
+    modellingAndValidation: "ModellingAndValidation" = create_element_process_dataset(
+        "modellingAndValidation"
+    )
+    """Covers the five sub-sections 1) LCI method and allocation, 2) Data
+    sources, treatment and representativeness, 3) Completeness, 4) Validation,
+    and 5) Compliance. (Section refers to LCI modelling and data treatment
+    aspects etc., NOT the modeling of e.g. the input/output-relationships of a
+    parameterised data set.)"""
 
-    @property
-    def administrativeInformation(self) -> "AdministrativeInformation":
-        """Information on data set management and administration."""
-        return get_element(self, "administrativeInformation")
+    administrativeInformation: "AdministrativeInformation" = (
+        create_element_process_dataset("administrativeInformation")
+    )
+    """Information on data set management and administration."""
 
-    @property
-    def exchanges(self) -> "Exchanges":
-        """Input/Output list of exchanges with the quantitative inventory data,
-        as well as pre-calculated LCIA results."""
-        return get_element(self, "exchanges")
+    exchanges: "Exchanges" = create_element_process_dataset("exchanges")
+    """Input/Output list of exchanges with the quantitative inventory data,
+    as well as pre-calculated LCIA results."""
 
-    @property
-    def lciaResults(self) -> "LCIAResults":
-        """List with the pre-calculated LCIA results of the Input/Output list
-        of this data set. May contain also inventory-type results such as primary
-        energy consumption etc."""
-        return get_element(self, "LCIAResults")
+    lciaResults: "LCIAResults" = create_element_process_dataset("LCIAResults")
+    """List with the pre-calculated LCIA results of the Input/Output list
+    of this data set. May contain also inventory-type results such as primary
+    energy consumption etc."""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Reads the whole data set into nested dicts in a single walk over the
+        tree, keyed by the local names of attributes and elements. Texts are kept
+        as strings; repeated elements become lists."""
+        return element_to_dict(self)
 
 
 class ProcessInformation(etree.ElementBase):
@@ -83,46 +160,40 @@ class ProcessInformation(etree.ElementBase):
     reference", 3) "Time", 4) "Geography", 5) "Technology" and 6) "Mathematical
     relations"."""
 
-    @property
-    def dataSetInformation(self) -> "DataSetInformation":
-        """General data set information. Section covers all single fields in
-        the ISO/TS 14048 "Process description", which are not part of the other
-        sub-sections. In ISO/TS 14048 no own sub-section is foreseen for these
-        entries."""
-        return get_element(self, "dataSetInformation")
+    dataSetInformation: "DataSetInformation" = create_element_at_process_dataset(
+        "dataSetInformation", 0
+    )
+    """General data set information. Section covers all single fields in
+    the ISO/TS 14048 "Process description", which are not part of the other
+    sub-sections. In ISO/TS 14048 no own sub-section is foreseen for these
+    entries."""
 
-    @property
-    def quantitativeReference(self) -> "QuantitativeReference":
-        """This section names the quantitative reference used for this data
-        set, i.e. the reference to which the inputs and outputs quantiatively
-        relate."""
-        return get_element(self, "quantitativeReference")
+    quantitativeReference: "QuantitativeReference" = create_element_process_dataset(
+        "quantitativeReference"
+    )
+    """This section names the quantitative reference used for this data
+    set, i.e. the reference to which the inputs and outputs quantiatively
+    relate."""
 
-    @property
-    def time(self) -> "Time":
-        """Provides information about the time representativeness of the dataset."""
-        return get_element(self, "time")
+    time: "Time" = create_element_process_dataset("time")
+    """Provides information about the time representativeness of the dataset."""
 
-    @property
-    def geography(self) -> "Geography":
-        """Provides information about the geographical representativeness of
-        the dataset."""
-        return get_element(self, "geography")
+    geography: "Geography" = create_element_process_dataset("geography")
+    """Provides information about the geographical representativeness of
+    the dataset."""
 
-    @property
-    def technology(self) -> "Technology":
-        """Provides information about the technological representativeness of
-        the data set."""
-        return get_element(self, "technology")
+    technology: "Technology" = create_element_process_dataset("technology")
+    """Provides information about the technological representativeness of
+    the data set."""
 
-    @property
-    def mathematicalRelations(self) -> "MathematicalRelations":
-        """A set of formulas that allows to model the amount of single
-        exchanges in the input and output list in dependency of each other and/or
-        in dependency of parameters. Used to provide a process model ("parameterized
-        process") for calculation of inventories in dependency of user settings of e.g.
-        yield, efficiency of abatement measures, processing of different educts, etc."""
-        return get_element(self, "mathematicalRelations")
+    mathematicalRelations: "MathematicalRelations" = create_element_process_dataset(
+        "mathematicalRelations"
+    )
+    """A set of formulas that allows to model the amount of single
+    exchanges in the input and output list in dependency of each other and/or
+    in dependency of parameters. Used to provide a process model ("parameterized
+    process") for calculation of inventories in dependency of user settings of e.g.
+    yield, efficiency of abatement measures, processing of different educts, etc."""
 
 
 class ModellingAndValidation(etree.ElementBase):
@@ -132,77 +203,81 @@ class ModellingAndValidation(etree.ElementBase):
     etc., NOT the modeling of e.g. the input/output-relationships of a parameterised
     data set.)"""
 
-    @property
-    def lciMethodAndAllocation(self) -> "LCIMethodAndAllocation":
-        """LCI methodological modelling aspects including allocation /
-        substitution information."""
-        return get_element(self, "LCIMethodAndAllocation")
+    lciMethodAndAllocation: "LCIMethodAndAllocation" = create_element_process_dataset(
+        "LCIMethodAndAllocation"
+    )
+    """LCI methodological modelling aspects including allocation /
+    substitution information."""
 
-    @property
-    def dataSourcesTreatmentAndRepresentativeness(
-        self,
-    ) -> "DataSourcesTreatmentAndRepresentativeness":
-        """Data selection, completeness, and treatment principles and
-        procedures, data sources and market coverage information."""
-        return get_element(self, "dataSourcesTreatmentAndRepresentativeness")
+    dataSourcesTreatmentAndRepresentativeness: (
+        "DataSourcesTreatmentAndRepresentativeness"
+    ) = create_element_process_dataset("dataSourcesTreatmentAndRepresentativeness")
+    """Data selection, completeness, and treatment principles and
+    procedures, data sources and market coverage information."""
 
-    @property
-    def completeness(self) -> "Completeness":
-        """Data completeness aspects for this specific data set."""
-        return get_element(self, "completeness")
+    completeness: "Completeness" = create_element_process_dataset("completeness")
+    """Data completeness aspects for this specific data set."""
 
-    @property
-    def validation(self) -> "Validation":
-        """Review / validation information on data set."""
-        return get_element(self, "validation")
+    validation: "Validation" = create_element_process_dataset("validation")
+    """Review / validation information on data set."""
 
-    @property
-    def complianceDeclarations(self) -> "ComplianceDeclarations":
-        """Statements on compliance of several data set aspects with
-        compliance requirements as defined by the referenced compliance system
-        (e.g. an EPD scheme, handbook of a national or international data network
-        such as the ILCD, etc.)."""
-        return get_element(self, "complianceDeclarations")
+    complianceDeclarations: "ComplianceDeclarations" = create_element_process_dataset(
+        "complianceDeclarations"
+    )
+    """Statements on compliance of several data set aspects with
+    compliance requirements as defined by the referenced compliance system
+    (e.g. an EPD scheme, handbook of a national or international data network
+    such as the ILCD, etc.)."""
 
 
 class AdministrativeInformation(etree.ElementBase):
     """Information on data set management and administration."""
 
-    @property
-    def commissionerAndGoal(self) -> "CommissionerAndGoal":
-        """Basic information about goal and scope of the data set."""
-        return get_element(self, "common:commissionerAndGoal")
+    commissionerAndGoal: "CommissionerAndGoal" = create_element_process_dataset(
+        "common:commissionerAndGoal"
+    )
+    """Basic information about goal and scope of the data set."""
 
-    @property
-    def dataGenerator(self) -> "DataGenerator":
-        """Expert(s), that compiled and modelled the data set as well as
-        internal administrative information linked to the data generation
-        activity."""
-        return get_element(self, "dataGenerator")
+    dataGenerator: "DataGenerator" = create_element_process_dataset("dataGenerator")
+    """Expert(s), that compiled and modelled the data set as well as
+    internal administrative information linked to the data generation
+    activity."""
 
-    @property
-    def dataEntryBy(self) -> "DataEntryBy":
-        """Staff or entity, that documented the generated data set, entering
-        the information into the database; plus administrative information
-        linked to the data entry activity."""
-        return get_element(self, "dataEntryBy")
+    dataEntryBy: "DataEntryBy" = create_element_process_dataset("dataEntryBy")
+    """Staff or entity, that documented the generated data set, entering
+    the information into the database; plus administrative information
+    linked to the data entry activity."""
 
-    @property
-    def publicationAndOwnership(self) -> "PublicationAndOwnership":
-        """Information related to publication and version management of the
-        data set including copyright and access restrictions."""
-        return get_element(self, "publicationAndOwnership")
+    publicationAndOwnership: "PublicationAndOwnership" = create_element_process_dataset(
+        "publicationAndOwnership"
+    )
+    """Information related to publication and version management of the
+    data set including copyright and access restrictions."""
 
 
 class Exchanges(etree.ElementBase):
     """Input/Output list of exchanges with the quantitative inventory data,
     as well as pre-calculated LCIA results."""
 
-    @property
-    def exchanges(self) -> List["Exchange"]:
-        """Input/Output list of exchanges with the quantitative inventory data
-        as well as pre-calculated LCIA results."""
-        return get_element_list(self, "exchange")
+    exchanges: List["Exchange"] = create_element_list_process_dataset("exchange")
+    """Input/Output list of exchanges with the quantitative inventory data
+    as well as pre-calculated LCIA results."""
+
+    def iter_exchanges(self) -> Iterator["Exchange"]:
+        """Lazily iterates over the exchanges without building a list."""
+        return iter_elements_process_dataset(self, "exchange")
+
+    def read_amounts(self) -> Dict[str, List[float]]:
+        """Reads the amounts of all exchanges column-wise in a single walk over
+        the exchanges, keyed by the name of the Exchange property. Missing amounts
+        are nan, so the columns stay aligned and can be handed to e.g.
+        ``numpy.asarray`` as they are."""
+        columns = tuple([] for _ in _EXCHANGE_AMOUNTS)
+        for exchange in self.iter_exchanges():
+            texts = _READ_EXCHANGE_AMOUNTS(exchange).split("|")
+            for column, text in zip(columns, texts):
+                column.append(float(text) if text else nan)
+        return dict(zip(_EXCHANGE_AMOUNTS, columns))
 
 
 class LCIAResults(etree.ElementBase):
@@ -210,10 +285,12 @@ class LCIAResults(etree.ElementBase):
     of this data set. May contain also inventory-type results such as primary
     energy consumption etc."""
 
-    @property
-    def lciaResults(self) -> List["LCIAResult"]:
-        """Single LCIA result"""
-        return get_element_list(self, "LCIAResult")
+    lciaResults: List["LCIAResult"] = create_element_list_process_dataset("LCIAResult")
+    """Single LCIA result"""
+
+    def iter_lcia_results(self) -> Iterator["LCIAResult"]:
+        """Lazily iterates over the LCIA results without building a list."""
+        return iter_elements_process_dataset(self, "LCIAResult")
 
 
 class DataSetInformation(etree.ElementBase):
@@ -221,7 +298,7 @@ class DataSetInformation(etree.ElementBase):
     the ISO/TS 14048 "Process description", which are not part of the other
     sub-sections. In ISO/TS 14048 no own sub-section is foreseen for these entries."""
 
-    commonUUID = create_attribute_process_dataset("common:UUID", str)
+    commonUUID = create_element_text_process_dataset("common:UUID", str)
     """Automatically generated Universally Unique Identifier of this data
     set. Together with the "Data set version", the UUID uniquely identifies each data
     set."""
@@ -240,65 +317,70 @@ class DataSetInformation(etree.ElementBase):
     and that together represent the complete inventory. Care has to be taken when
     naming the reference flow, to avoid misinterpretation.."""
 
-    synonyms = create_attribute_list_process_dataset("common:synonyms", str)
+    synonyms = create_text_list_process_dataset("common:synonyms")
     """Synonyms / alternative names / brands of the good, service, or
     process. Separated by semicolon."""
 
-    generalComments = create_attribute_list_process_dataset(
-        "common:generalComment", str
-    )
+    generalComments = create_text_list_process_dataset("common:generalComment")
     """General information about the data set, including e.g. general
     (internal, not reviewed) quality statements as well as information sources used.
     (Note: Please also check the more specific fields e.g. on "Intended application",
     "Advice on data set use" and the fields in the "Modelling and validation" section
     to avoid overlapping entries.)"""
 
-    @property
-    def name(self) -> "Name":
-        """General descriptive and specifying name of the process."""
-        return get_element(self, "name")
+    name: "Name" = create_element_process_dataset("name")
+    """General descriptive and specifying name of the process."""
 
-    @property
-    def complementingProcesses(self) -> "ComplementingProcesses":
-        """Process data set(s)" that complement this partial / sub-set of a
-        complete process data set, if any and available as separate data set(s). The
-        identifying name of this sub-set should be stated in the field "Identifier of
-        sub-data set"."""
-        return get_element(self, "complementingProcesses")
+    complementingProcesses: "ComplementingProcesses" = create_element_process_dataset(
+        "complementingProcesses"
+    )
+    """Process data set(s)" that complement this partial / sub-set of a
+    complete process data set, if any and available as separate data set(s). The
+    identifying name of this sub-set should be stated in the field "Identifier of
+    sub-data set"."""
 
-    @property
-    def classificationInformation(self) -> "FlowCategoryInformation":
-        """Hierarchical classification of the good, service, or process.
-        (Note: This entry is NOT required for the identification of a Process. It should
-        nevertheless be avoided to use identical names for Processes in the same
-        category."""
-        return get_element(self, "classificationInformation")
+    classificationInformation: "FlowCategoryInformation" = (
+        create_element_process_dataset("classificationInformation")
+    )
+    """Hierarchical classification of the good, service, or process.
+    (Note: This entry is NOT required for the identification of a Process. It should
+    nevertheless be avoided to use identical names for Processes in the same
+    category."""
 
-    @property
-    def referenceToExternalDocumentation(self) -> "GlobalReference":
-        """ "Source data set(s)" of detailed LCA study on the process or
-        product represented by this data set, as well as documents / files with
-        overarching documentative information on technology, geographical and / or time
-        aspects etc. (e.g. basic engineering studies, process simulation results,
-        patents, plant documentation, model behind the parameterisation of the
-        "Mathematical model" section, etc.) (Note: can indirectly reference to
-        digital file.)"""
-        return get_element(self, "referenceToExternalDocumentation")
+    referenceToExternalDocumentation: "GlobalReference" = (
+        create_element_process_dataset("referenceToExternalDocumentation")
+    )
+    """ "Source data set(s)" of detailed LCA study on the process or
+    product represented by this data set, as well as documents / files with
+    overarching documentative information on technology, geographical and / or time
+    aspects etc. (e.g. basic engineering studies, process simulation results,
+    patents, plant documentation, model behind the parameterisation of the
+    "Mathematical model" section, etc.) (Note: can indirectly reference to
+    digital file.)"""
+
+    def as_tuple(self) -> DataSetInformationTuple:
+        """Reads all fields of the data set information in a single walk over its
+        children instead of one lookup per property."""
+        return DataSetInformationTuple(
+            self.commonUUID,
+            self.identifierOfSubDataSet,
+            *_READ_DATA_SET_INFORMATION(self),
+        )
 
 
 class QuantitativeReference(etree.ElementBase):
     """This section names the quantitative reference used for this data
     set, i.e. the reference to which the inputs and outputs quantiatively relate."""
 
+    __slots__ = ()
+
     referenceToReferenceFlow = create_attribute_list_process_dataset(
         "referenceToReferenceFlow", int
     )
     """One or more of the Inputs or Outputs in case "Type of quantitative
     reference" is of type "Reference flow(s)". (Data set internal reference.)"""
 
-    functionalUnitOrOther = create_attribute_list_process_dataset(
-        "functionalUnitOrOther", str
-    )
+    functionalUnitOrOther = create_text_list_process_dataset("functionalUnitOrOther")
     """Quantity, name, property/quality, and measurement unit of the
     Functional unit, Production period, or Other parameter, in case "Type of
     quantitative reference" is of one of these types. [Note: One or more functional
@@ -311,71 +393,76 @@ class QuantitativeReference(etree.ElementBase):
 class Time(etree.ElementBase):
     """Provides information about the time representativeness of the dataset."""
 
-    referenceYear = create_element_text_process_dataset("referenceYear", int)
+    __slots__ = ()
+
+    referenceYear = create_element_text_process_dataset("common:referenceYear", int)
     """Start year of the time period for which the data set is valid (until year
     of "Data set valid until:"). For data sets that combine data from different
     years, the most representative year is given regarding the overall environmental
     impact. In that case, the reference year is derived by expert judgement."""
 
-    dataSetValidUntil = create_element_text_process_dataset("dataSetValidUntil", int)
+    dataSetValidUntil = create_element_text_process_dataset(
+        "common:dataSetValidUntil", int
+    )
     """End year of the time period for which the data set is still valid /
     sufficiently representative. This date also determines when a data set revision /
     remodelling is required or recommended due to expected relevant changes in
     environmentally or technically relevant inventory values, including in the
     background system."""
 
-    timeRepresentativenessDescription = create_attribute_list_process_dataset(
-        "timeRepresentativenessDescription", str
+    timeRepresentativenessDescription = create_text_list_process_dataset(
+        "common:timeRepresentativenessDescription"
     )
     """Description of the valid time span of the data set including information on
     limited usability within sub-time spans (e.g. summer/winter)."""
 
+    def as_tuple(self) -> TimeTuple:
+        """Reads all fields of the time representativeness in a single walk over
+        its children instead of one lookup per property."""
+        return TimeTuple(*_READ_TIME(self))
+
 
 class Geography(etree.ElementBase):
     """Provides information about the geographical representativeness of the dataset."""
 
-    @property
-    def locationOfOperationSupplyOrProduction(
-        self,
-    ) -> "LocationOfOperationSupplyOrProduction":
-        """Location, country or region the data set represents. [Note 1: This
-        field does not refer to e.g. the country in which a specific site is located
-        that is represented by this data set but to the actually represented country,
-        region, or site. Note 2: Entry can be of type "two-letter ISO 3166 country
-        code" for countries, "seven-letter regional codes" for regions or continents,
-        or "market areas and market organisations", as predefined for the ILCD. Also
-        a name for e.g. a specific plant etc. can be given here (e.g. "FR, Lyon, XY
-        Company, Z Site"; user defined). Note 3: The fact whether the entry refers to
-        production or to consumption / supply has to be stated in the name-field "Mix
-        and location types" e.g. as "Production mix".]"""
-        return get_element(self, "locationOfOperationSupplyOrProduction")
-
-    @property
-    def subLocationOfOperationSupplyOrProduction(
-        self,
-    ) -> List["SubLocationOfOperationSupplyOrProduction"]:
-        """One or more geographical sub-unit(s) of the stated "Location". Such
-        sub-units can be e.g. the sampling sites of a company-average data set, the
-        countries of a region-average data set, or specific sites in a country-average
-        data set. [Note: For single site data sets this field is empty and the site is
-        named in the "Location" field.]"""
-        return get_element_list(self, "subLocationOfOperationSupplyOrProduction")
+    locationOfOperationSupplyOrProduction: "LocationOfOperationSupplyOrProduction" = (
+        create_element_process_dataset("locationOfOperationSupplyOrProduction")
+    )
+    """Location, country or region the data set represents. [Note 1: This
+    field does not refer to e.g. the country in which a specific site is located
+    that is represented by this data set but to the actually represented country,
+    region, or site. Note 2: Entry can be of type "two-letter ISO 3166 country
+    code" for countries, "seven-letter regional codes" for regions or continents,
+    or "market areas and market organisations", as predefined for the ILCD. Also
+    a name for e.g. a specific plant etc. can be given here (e.g. "FR, Lyon, XY
+    Company, Z Site"; user defined). Note 3: The fact whether the entry refers to
+    production or to consumption / supply has to be stated in the name-field "Mix
+    and location types" e.g. as "Production mix".]"""
+
+    subLocationOfOperationSupplyOrProduction: List[
+        "SubLocationOfOperationSupplyOrProduction"
+    ] = create_element_list_process_dataset("subLocationOfOperationSupplyOrProduction")
+    """One or more geographical sub-unit(s) of the stated "Location". Such
+    sub-units can be e.g. the sampling sites of a company-average data set, the
+    countries of a region-average data set, or specific sites in a country-average
+    data set. [Note: For single site data sets this field is empty and the site is
+    named in the "Location" field.]"""
 
 
 class Technology(etree.ElementBase):
     """Provides information about the technological representativeness of the
     dataset."""
 
-    technologyDescriptionAndIncludedProcesses = create_attribute_list_process_dataset(
-        "technologyDescriptionAndIncludedProcesses", str
+    technologyDescriptionAndIncludedProcesses = create_text_list_process_dataset(
+        "technologyDescriptionAndIncludedProcesses"
     )
     """Description of the technological characteristics including
     operating conditions of the process or product system. For the latter this
     includes the relevant upstream and downstream processes included in the data set.
     Professional terminology should be used."""
 
-    technologicalApplicability = create_attribute_list_process_dataset(
-        "technologicalApplicability", str
+    technologicalApplicability = create_text_list_process_dataset(
+        "technologicalApplicability"
     )
     """Description of the intended / possible applications of the good,
     service, or process. E.g. for which type of products the material, represented by
@@ -384,25 +471,27 @@ class Technology(etree.ElementBase):
     for large scale synthesis in chemical industry.". Or: "This truck is used only for
     long-distance transport of liquid bulk chemicals"."""
 
-    @property
-    def referenceToIncludedProcesses(self) -> List["GlobalReference"]:
-        """ "Process data set(s)" included in this data set, if any and
-        available as separate data set(s)."""
-        return get_element_list(self, "referenceToIncludedProcesses")
+    referenceToIncludedProcesses: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToIncludedProcesses")
+    )
+    """ "Process data set(s)" included in this data set, if any and
+    available as separate data set(s)."""
 
-    @property
-    def referenceToTechnologyPictogramme(self) -> "GlobalReference":
-        """ "Source data set" of the pictogramme of the good, service,
-        technogy, plant etc. represented by this data set. For use in graphical user
-        interfaces of LCA software."""
-        return get_element(self, "referenceToTechnologyPictogramme")
+    referenceToTechnologyPictogramme: "GlobalReference" = (
+        create_element_process_dataset("referenceToTechnologyPictogramme")
+    )
+    """ "Source data set" of the pictogramme of the good, service,
+    technogy, plant etc. represented by this data set. For use in graphical user
+    interfaces of LCA software."""
 
-    @property
-    def referenceToTechnologyFlowDiagrammOrPicture(self) -> List["GlobalReference"]:
-        """ "Source data set" of the flow diagramm(s) and/or photo(s) of the
-        good, service, technology, plant etc represented by this data set. For clearer
-        illustration and documentation of data set."""
-        return get_element_list(self, "referenceToTechnologyFlowDiagrammOrPicture")
+    referenceToTechnologyFlowDiagrammOrPicture: List["GlobalReference"] = (
+        create_element_list_process_dataset(
+            "referenceToTechnologyFlowDiagrammOrPicture"
+        )
+    )
+    """ "Source data set" of the flow diagramm(s) and/or photo(s) of the
+    good, service, technology, plant etc represented by this data set. For clearer
+    illustration and documentation of data set."""
 
 
 class MathematicalRelations(etree.ElementBase):
@@ -412,24 +501,35 @@ class MathematicalRelations(etree.ElementBase):
     process") for calculation of inventories in dependency of user settings of e.g.
     yield, efficiency of abatement measures, processing of different educts, etc."""
 
-    modelDescription = create_attribute_list_process_dataset("modelDescription", str)
+    modelDescription = create_text_list_process_dataset("modelDescription")
     """Description of the model(s) represented in this section of
     mathematical relations. Can cover information on restrictions, model strenghts
     and weaknesses, etc. (Note: Also see information provided on the level of the
     individual formula in field "Comment" and in the general process description in
     the fields in section "Technology".)"""
 
-    @property
-    def variableParameter(self) -> List["VariableParameter"]:
-        """Name of variable or parameter used as scaling factors for the "Mean
-        amount" of individual inputs or outputs of the data set."""
-        return get_element_list(self, "variableParameter")
+    variableParameter: List["VariableParameter"] = create_element_list_process_dataset(
+        "variableParameter"
+    )
+    """Name of variable or parameter used as scaling factors for the "Mean
+    amount" of individual inputs or outputs of the data set."""
+
+    def read_variables(self) -> Dict[str, float]:
+        """Reads the mean values of all variables and parameters keyed by their
+        name in a single walk, so that exchanges can be scaled through their
+        referenceToVariable without looking the variable up in the tree each time."""
+        return {
+            variable.name: variable.meanValue
+            for variable in iter_elements_process_dataset(self, "variableParameter")
+        }
 
 
 class LCIMethodAndAllocation(etree.ElementBase):
     """LCI methodological modelling aspects including allocation /
     substitution information."""
 
+    __slots__ = ()
+
     typeOfDataSet = create_element_text_process_dataset("typeOfDataSet", str)
     """Type of the data set regarding systematic inclusion/exclusion of
     upstream or downstream processes, transparency and internal (hidden)
@@ -440,8 +540,8 @@ class LCIMethodAndAllocation(etree.ElementBase):
     regarding using average data (= attributional = non-marginal) or modelling effects
     in a change-oriented way (= consequential = marginal)."""
 
-    deviationsFromLCIMethodPrinciple = create_attribute_list_process_dataset(
-        "deviationsFromLCIMethodPrinciple", str
+    deviationsFromLCIMethodPrinciple = create_text_list_process_dataset(
+        "deviationsFromLCIMethodPrinciple"
     )
     """Short description of any deviations from the general "LCI method
     principles" and additional explanations. Refers especially to specific
@@ -452,15 +552,13 @@ class LCIMethodAndAllocation(etree.ElementBase):
     co-products may be reported here as well. In case of no (quantitatively relevant)
     deviations from the LCI method principle, "none" should be stated."""
 
-    LCIMethodApproaches = create_attribute_list_process_dataset(
-        "LCIMethodApproaches", str
-    )
+    LCIMethodApproaches = create_text_list_process_dataset("LCIMethodApproaches")
     """Names briefly the specific approach(es) used in LCI modeling, e.g.
     allocation, substitution etc. In case of LCI results and Partly terminated system
     data sets this also covers those applied in the included background system."""
 
-    deviationsFromLCIMethodApproaches = create_attribute_list_process_dataset(
-        "deviationsFromLCIMethodApproaches", str
+    deviationsFromLCIMethodApproaches = create_text_list_process_dataset(
+        "deviationsFromLCIMethodApproaches"
     )
     """Description of relevant deviations from the applied approaches as
     well as of the relevant specific approaches that were applied, including in an
@@ -472,35 +570,35 @@ class LCIMethodAndAllocation(etree.ElementBase):
     before stated LCI method approaches, and in case of no need for further
     explanations, "none" is entered."""
 
-    modellingConstants = create_attribute_list_process_dataset(
-        "modellingConstants", str
-    )
+    modellingConstants = create_text_list_process_dataset("modellingConstants")
     """Short identification and description of constants applied in LCI
     modelling other than allocation / substitution, e.g. systematic setting of
     recycling quota, use of gross or net calorific value, etc."""
 
-    deviationsFromModellingConstants = create_attribute_list_process_dataset(
-        "deviationsFromModellingConstants", str
+    deviationsFromModellingConstants = create_text_list_process_dataset(
+        "deviationsFromModellingConstants"
     )
     """Short description of data set specific deviations from the
     "Modelling constants" if any, including in the possibly included background
     system."""
 
-    @property
-    def referenceToLCAMethodDetails(self) -> List["GlobalReference"]:
-        """ "Source data set"(s) where the generally used LCA methods including
-        the LCI method principles and specific approaches, the modelling constants
-        details, as well as any other applied methodological conventions are
-        described."""
-        return get_element_list(self, "referenceToLCAMethodDetails")
+    referenceToLCAMethodDetails: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToLCAMethodDetails")
+    )
+    """ "Source data set"(s) where the generally used LCA methods including
+    the LCI method principles and specific approaches, the modelling constants
+    details, as well as any other applied methodological conventions are
+    described."""
 
 
 class DataSourcesTreatmentAndRepresentativeness(etree.ElementBase):
     """Data selection, completeness, and treatment principles and
     procedures, data sources and market coverage information."""
 
-    dataCutOffAndCompletenessPrinciples = create_attribute_list_process_dataset(
-        "dataCutOffAndCompletenessPrinciples", str
+    __slots__ = ()
+
+    dataCutOffAndCompletenessPrinciples = create_text_list_process_dataset(
+        "dataCutOffAndCompletenessPrinciples"
     )
     """Principles applied in data collection regarding completeness of
     (also intermediate) product and waste flows and of elementary flows.
@@ -508,41 +606,37 @@ class DataSourcesTreatmentAndRepresentativeness(etree.ElementBase):
     services or auxiliaries, etc. systematic exclusion of air in incineration
     processes, coling water, etc."""
 
-    deviationsFromCutOffAndCompletenessPrinciples = (
-        create_attribute_list_process_dataset(
-            "deviationsFromCutOffAndCompletenessPrinciples", str
-        )
+    deviationsFromCutOffAndCompletenessPrinciples = create_text_list_process_dataset(
+        "deviationsFromCutOffAndCompletenessPrinciples"
     )
     """Short description of any deviations from the "Data completeness
     principles". In case of no (result relevant) deviations, "none" is entered."""
 
-    dataSelectionAndCombinationPrinciples = create_attribute_list_process_dataset(
-        "dataSelectionAndCombinationPrinciples", str
+    dataSelectionAndCombinationPrinciples = create_text_list_process_dataset(
+        "dataSelectionAndCombinationPrinciples"
     )
     """Principles applied in data selection and in combination of data
     from different sources. Includes brief discussion of consistency of data sources
     regarding data itself, modelling, appropriateness. In case of averaging:
     Principles and data selection applied in horizontal and / or vertical averaging."""
 
-    deviationsFromSelectionAndCombinationPrinciples = (
-        create_attribute_list_process_dataset(
-            "deviationsFromSelectionAndCombinationPrinciples", str
-        )
+    deviationsFromSelectionAndCombinationPrinciples = create_text_list_process_dataset(
+        "deviationsFromSelectionAndCombinationPrinciples"
     )
     """Short description of any deviations from the "Data selection and
     combination principles". In case of no (result relevant) deviations, "none" is
     entered."""
 
-    dataTreatmentAndExtrapolationsPrinciples = create_attribute_list_process_dataset(
-        "dataTreatmentAndExtrapolationsPrinciples", str
+    dataTreatmentAndExtrapolationsPrinciples = create_text_list_process_dataset(
+        "dataTreatmentAndExtrapolationsPrinciples"
     )
     """Principles applied regarding methods, sources, and assumptions done
     in data adjustment including extrapolations of data from another time period,
     another geographical area, or another technology."""
 
     deviationsFromTreatmentAndExtrapolationPrinciples = (
-        create_attribute_list_process_dataset(
-            "deviationsFromTreatmentAndExtrapolationPrinciples", str
+        create_text_list_process_dataset(
+            "deviationsFromTreatmentAndExtrapolationPrinciples"
         )
     )
     """Short description of any deviations from the " Data treatment and
@@ -562,8 +656,8 @@ class DataSourcesTreatmentAndRepresentativeness(etree.ElementBase):
     '0'. The representativity for the original "Location" is documented in the field
     "Deviation from data treatment and extrapolation principles, explanations"."""
 
-    annualSupplyOrProductionVolume = create_attribute_list_process_dataset(
-        "annualSupplyOrProductionVolume", str
+    annualSupplyOrProductionVolume = create_text_list_process_dataset(
+        "annualSupplyOrProductionVolume"
     )
     """Supply / consumption or production volume of the specific good,
     service, or technology in the region/market of the stated "Location". The market
@@ -571,21 +665,17 @@ class DataSourcesTreatmentAndRepresentativeness(etree.ElementBase):
     "Reference year". For multi-fucntional processes the data should be given for all
     co-functions (good and services)."""
 
-    samplingProcedure = create_attribute_list_process_dataset("samplingProcedure", str)
+    samplingProcedure = create_text_list_process_dataset("samplingProcedure")
     """Sampling procedure used for quantifying the amounts of Inputs and
     Outputs. Possible problems in combining different sampling procedures should be
     mentioned."""
 
-    dataCollectionPeriod = create_attribute_list_process_dataset(
-        "dataCollectionPeriod", str
-    )
+    dataCollectionPeriod = create_text_list_process_dataset("dataCollectionPeriod")
     """Date(s) or time period(s) when the data was collected. Note that
     this does NOT refer to e.g. the publication dates of papers or books from which
     the data may stem, but to the original data collection period."""
 
-    uncertaintyAdjustments = create_attribute_list_process_dataset(
-        "uncertaintyAdjustments", str
-    )
+    uncertaintyAdjustments = create_text_list_process_dataset("uncertaintyAdjustments")
     """Description of methods, sources, and assumptions made in
     uncertainty adjustment. [Note: For data sets where the additional uncertainty due
     to lacking representativeness has been included in the quantified uncertainty
@@ -593,38 +683,36 @@ class DataSourcesTreatmentAndRepresentativeness(etree.ElementBase):
     uncertainty, and the procedure by which the overall uncertainty was assessed or
     calculated.]"""
 
-    useAdviceForDataSet = create_attribute_list_process_dataset(
-        "useAdviceForDataSet", str
-    )
+    useAdviceForDataSet = create_text_list_process_dataset("useAdviceForDataSet")
     """Specific methodological advice for data set users that requires
     attention. E.g. on inclusion/exclusion of recycling e.g. in material data sets,
     specific use phase behavior to be modelled, and other methodological advices. See
     also field "Technological applicability"."""
 
-    @property
-    def referenceToDataHandlingPrinciples(self) -> List["GlobalReference"]:
-        """ "Source data set"(s) of the source(s) in which the data
-        completeness, selection, combination, treatment, and
-        extrapolations principles' details are described"""
-        return get_element_list(self, "referenceToDataHandlingPrinciples")
+    referenceToDataHandlingPrinciples: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToDataHandlingPrinciples")
+    )
+    """ "Source data set"(s) of the source(s) in which the data
+    completeness, selection, combination, treatment, and
+    extrapolations principles' details are described"""
 
-    @property
-    def referenceToDataSource(self) -> List["GlobalReference"]:
-        """ "Source data set"(s) of the source(s) used for deriving/compiling
-        the inventory of this data set e.g. questionnaires, monographies,
-        plant operation protocols, etc. For LCI results and Partly
-        terminated systems the sources for relevant background system
-        data are to be given, too. For parameterised data sets the sources
-        used for the parameterisation / mathematical relations in the section
-        "Mathematical model" are referenced here as well. [Note: If the data
-        set stems from another database or data set publication and is only
-        re-published: identify the origin of a converted data set in
-        "Converted original data set from:" field in section "Data entry by"
-        and its unchanged re-publication in "Unchanged re-publication of:"
-        in the section "Publication and ownership". The data sources used
-        to model a converted or re-published data set are nevertheless to
-        be given here in this field, for transparency reasons.]"""
-        return get_element_list(self, "referenceToDataSource")
+    referenceToDataSource: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToDataSource")
+    )
+    """ "Source data set"(s) of the source(s) used for deriving/compiling
+    the inventory of this data set e.g. questionnaires, monographies,
+    plant operation protocols, etc. For LCI results and Partly
+    terminated systems the sources for relevant background system
+    data are to be given, too. For parameterised data sets the sources
+    used for the parameterisation / mathematical relations in the section
+    "Mathematical model" are referenced here as well. [Note: If the data
+    set stems from another database or data set publication and is only
+    re-published: identify the origin of a converted data set in
+    "Converted original data set from:" field in section "Data entry by"
+    and its unchanged re-publication in "Unchanged re-publication of:"
+    in the section "Publication and ownership". The data sources used
+    to model a converted or re-published data set are nevertheless to
+    be given here in this field, for transparency reasons.]"""
 
 
 class Completeness(etree.ElementBase):
@@ -639,48 +727,48 @@ class Completeness(etree.ElementBase):
     environmental relevance, i.e. for unit processes including the upstream and
     downstream burdens of product and waste flows.]"""
 
-    completenessOtherProblemField = create_attribute_list_process_dataset(
-        "completenessOtherProblemField", str
+    completenessOtherProblemField = create_text_list_process_dataset(
+        "completenessOtherProblemField"
     )
     """Completeness of coverage of elementary flows that contribute to
     other problem fields that are named here as free text, preferably
     using the same terminology as for the specified environmental problems."""
 
-    @property
-    def completenessElementaryFlows(self) -> List["CompletenessElementaryFlows"]:
-        """ "Completeness of the elementary flows in the Inputs and Outputs
-        section of this data set from impact perspective, regarding addressing the
-        individual mid-point problem field / impact category given. The completeness
-        refers to the state-of-the-art of scientific knowledge whether or not an
-        individual elementary flow contributes to the respective mid-point topic in a
-        relevant way, which is e.g. the basis for the ILCD reference elementary flows.
-        [Note: The "Completeness" statement does not automatically mean that related
-        LCIA methods exist or reference the elementary flows of this data set. Hence
-        for direct applicability of existing LCIA methods, check the field "Supported
-        LCIA method data sets".]"""
-        return get_element_list(self, "completenessElementaryFlows")
+    completenessElementaryFlows: List["CompletenessElementaryFlows"] = (
+        create_element_list_process_dataset("completenessElementaryFlows")
+    )
+    """ "Completeness of the elementary flows in the Inputs and Outputs
+    section of this data set from impact perspective, regarding addressing the
+    individual mid-point problem field / impact category given. The completeness
+    refers to the state-of-the-art of scientific knowledge whether or not an
+    individual elementary flow contributes to the respective mid-point topic in a
+    relevant way, which is e.g. the basis for the ILCD reference elementary flows.
+    [Note: The "Completeness" statement does not automatically mean that related
+    LCIA methods exist or reference the elementary flows of this data set. Hence
+    for direct applicability of existing LCIA methods, check the field "Supported
+    LCIA method data sets".]"""
 
-    @property
-    def referenceToSupportedImpactAssessmentMethods(self) -> "GlobalReference":
-        """ "LCIA methods data sets" that can be applied to the elementary
-        flows in the Inputs and Outputs section, i.e. ALL these flows are referenced by
-        the respective LCIA method data set (if they are of environmental relevance and
-        a characterisation factor is defined for the respective flow). [Note:
-        Applicability is not given if the inventoty contains some elementary flows with
-        the same meaning as referenced in the LCIA method data set but in a different
-        nomenclature (and hence carry no characterisation factor), or if the flows are
-        sum indicators or flow groups that are addressed differently in the LCIA method
-        data set.]"""
-        return get_element(self, "referenceToSupportedImpactAssessmentMethods")
+    referenceToSupportedImpactAssessmentMethods: "GlobalReference" = (
+        create_element_process_dataset("referenceToSupportedImpactAssessmentMethods")
+    )
+    """ "LCIA methods data sets" that can be applied to the elementary
+    flows in the Inputs and Outputs section, i.e. ALL these flows are referenced by
+    the respective LCIA method data set (if they are of environmental relevance and
+    a characterisation factor is defined for the respective flow). [Note:
+    Applicability is not given if the inventoty contains some elementary flows with
+    the same meaning as referenced in the LCIA method data set but in a different
+    nomenclature (and hence carry no characterisation factor), or if the flows are
+    sum indicators or flow groups that are addressed differently in the LCIA method
+    data set.]"""
 
 
 class Validation(etree.ElementBase):
     """Review / validation information on data set."""
 
-    @property
-    def reviews(self) -> List["Review"]:
-        """Review information on data set."""
-        return get_element_list(self, "review")
+    __slots__ = ()
+
+    reviews: List["Review"] = create_element_list_process_dataset("review")
+    """Review information on data set."""
 
 
 class ComplianceDeclarations(etree.ElementBase):
@@ -689,25 +777,27 @@ class ComplianceDeclarations(etree.ElementBase):
     EPD scheme, handbook of a national or international data network such as the ILCD,
     etc.)."""
 
-    @property
-    def compliances(self) -> List["Compliance"]:
-        """One compliance declaration"""
-        return get_element_list(self, "compliance")
+    __slots__ = ()
+
+    compliances: List["Compliance"] = create_element_list_process_dataset("compliance")
+    """One compliance declaration"""
 
 
 class DataGenerator(etree.ElementBase):
     """Expert(s), that compiled and modelled the data set as well as
     internal administrative information linked to the data generation activity."""
 
-    @property
-    def referenceToPersonOrEntityGeneratingTheDataSet(self) -> List["GlobalReference"]:
-        """ "Contact data set" of the person(s), working group(s),
-        organisation(s) or database network, that generated the
-        data set, i.e. being responsible for its correctness regarding
-        methods, inventory, and documentative information."""
-        return get_element_list(
-            self, "common:referenceToPersonOrEntityGeneratingTheDataSet"
+    __slots__ = ()
+
+    referenceToPersonOrEntityGeneratingTheDataSet: List["GlobalReference"] = (
+        create_element_list_process_dataset(
+            "common:referenceToPersonOrEntityGeneratingTheDataSet"
         )
+    )
+    """ "Contact data set" of the person(s), working group(s),
+    organisation(s) or database network, that generated the
+    data set, i.e. being responsible for its correctness regarding
+    methods, inventory, and documentative information."""
 
 
 class DataEntryBy(DataEntryByGroup1, DataEntryByGroup2):
@@ -715,33 +805,33 @@ class DataEntryBy(DataEntryByGroup1, DataEntryByGroup2):
     the information into the database; plus administrative information linked to the
     data entry activity."""
 
-    @property
-    def referenceToConvertedOriginalDataSetFrom(self) -> "GlobalReference":
-        """ "Source data set" of the database or data set publication from
-        which this data set has been obtained by conversion. This can cover e.g.
-        conversion to a different format, applying a different nomenclature, mapping of
-        flow names, conversion of units, etc. This may however not have changed or
-        re-modeled the Inputs and Outputs, i.e. obtaining the same LCIA results. This
-        entry is required for converted data sets stemming originally from other LCA
-        databases (e.g. when re-publishing data from IISI, ILCD etc. databases). [Note:
-        Identically re-published data sets are identied in the field "Unchanged
-        re-publication of:" in the section "Publication and Ownership".]"""
-        return get_element(self, "common:referenceToConvertedOriginalDataSetFrom")
-
-    @property
-    def referenceToDataSetUseApproval(self) -> List["GlobalReference"]:
-        """ "Source data set": Names exclusively the producer or operator of
-        the good, service or technology represented by this data set, which officially
-        has approved this data set in all its parts. In case of nationally or
-        internationally averaged data sets, this will be the respective business
-        association. If no official approval has been given, the entry "No official
-        approval by producer or operator" is to be entered and the reference will
-        point to an empty "Contact data set". [Notes: The producer or operator may only
-        be named here, if a written approval of this data set was given. A recognition
-        of this data set by any other organisation then the producer/operator of the
-        good, service, or process is not to be stated here, but as a "review" in the
-        validation section.]"""
-        return get_element_list(self, "common:referenceToDataSetUseApproval")
+    referenceToConvertedOriginalDataSetFrom: "GlobalReference" = (
+        create_element_process_dataset("common:referenceToConvertedOriginalDataSetFrom")
+    )
+    """ "Source data set" of the database or data set publication from
+    which this data set has been obtained by conversion. This can cover e.g.
+    conversion to a different format, applying a different nomenclature, mapping of
+    flow names, conversion of units, etc. This may however not have changed or
+    re-modeled the Inputs and Outputs, i.e. obtaining the same LCIA results. This
+    entry is required for converted data sets stemming originally from other LCA
+    databases (e.g. when re-publishing data from IISI, ILCD etc. databases). [Note:
+    Identically re-published data sets are identied in the field "Unchanged
+    re-publication of:" in the section "Publication and Ownership".]"""
+
+    referenceToDataSetUseApproval: List["GlobalReference"] = (
+        create_element_list_process_dataset("common:referenceToDataSetUseApproval")
+    )
+    """ "Source data set": Names exclusively the producer or operator of
+    the good, service or technology represented by this data set, which officially
+    has approved this data set in all its parts. In case of nationally or
+    internationally averaged data sets, this will be the respective business
+    association. If no official approval has been given, the entry "No official
+    approval by producer or operator" is to be entered and the reference will
+    point to an empty "Contact data set". [Notes: The producer or operator may only
+    be named here, if a written approval of this data set was given. A recognition
+    of this data set by any other organisation then the producer/operator of the
+    good, service, or process is not to be stated here, but as a "review" in the
+    validation section.]"""
 
 
 class PublicationAndOwnership(
@@ -758,17 +848,17 @@ class PublicationAndOwnership(
     """A unique identifying number for this data set issued by the
     registration authority."""
 
-    @property
-    def referenceToRegistrationAuthority(self) -> "GlobalReference":
-        """ "Contact data set" of the authority that has registered this
-        data set."""
-        return get_element(self, "common:referenceToRegistrationAuthority")
+    referenceToRegistrationAuthority: "GlobalReference" = (
+        create_element_process_dataset("common:referenceToRegistrationAuthority")
+    )
+    """ "Contact data set" of the authority that has registered this
+    data set."""
 
-    @property
-    def referenceToOwnershipOfDataSet(self) -> "GlobalReference":
-        """ ""Contact data set" of the person or entity who owns this data set.
-        (Note: this is not necessarily the publisher of the data set.)"""
-        return get_element(self, "common:referenceToOwnershipOfDataSet")
+    referenceToOwnershipOfDataSet: "GlobalReference" = create_element_process_dataset(
+        "common:referenceToOwnershipOfDataSet"
+    )
+    """ ""Contact data set" of the person or entity who owns this data set.
+    (Note: this is not necessarily the publisher of the data set.)"""
 
 
 class Exchange(etree.ElementBase):
@@ -853,28 +943,26 @@ class Exchange(etree.ElementBase):
     was derived (e.g. measured, estimated etc.), respectively the status and relevancy
     of missing data."""
 
-    generalComment = create_attribute_list_process_dataset("generalComment", str)
+    generalComment = create_text_list_process_dataset("generalComment")
     """General comment on this specific Input or Output, e.g. commenting
     on the data sources used and their specific representatuveness etc., on the status
     of "finalisation" of an entry as workflow information, etc."""
 
-    @property
-    def referenceToFlowDataSet(self) -> "GlobalReference":
-        """ "Flow data set" of this Input or Output."""
-        return get_element(self, "referenceToFlowDataSet")
+    referenceToFlowDataSet: "GlobalReference" = create_element_at_process_dataset(
+        "referenceToFlowDataSet", 0
+    )
+    """ "Flow data set" of this Input or Output."""
 
-    @property
-    def allocations(self) -> "Allocations":
-        """ "Container tag for the specification of allocations if process has
-        more than one reference product. Use only for multifunctional processes."""
-        return get_element(self, "allocations")
+    allocations: "Allocations" = create_element_process_dataset("allocations")
+    """ "Container tag for the specification of allocations if process has
+    more than one reference product. Use only for multifunctional processes."""
 
-    @property
-    def referencesToDataSource(self) -> "ReferencesToDataSource":
-        """ "Source data set" of data source(s) used for the value of this
-        specific Input or Output, especially if differing from the general data source
-        used for this data set."""
-        return get_element(self, "referencesToDataSource")
+    referencesToDataSource: "ReferencesToDataSource" = create_element_process_dataset(
+        "referencesToDataSource"
+    )
+    """ "Source data set" of data source(s) used for the value of this
+    specific Input or Output, especially if differing from the general data source
+    used for this data set."""
 
 
 class LCIAResult(etree.ElementBase):
@@ -903,42 +991,40 @@ class LCIAResult(etree.ElementBase):
     value (= Minimum value). This data field remains empty when uniform or triangular
     uncertainty distribution is applied.]"""
 
-    commonGeneralComment = create_attribute_list_process_dataset(
-        "common:generalComment", str
-    )
+    commonGeneralComment = create_text_list_process_dataset("common:generalComment")
     """General comment on this specific LCIA result, e.g. commenting on
     the correspondence of the inputs and outputs with the applied LCIA method etc."""
 
-    @property
-    def referenceToLCIAMethodDataSets(self) -> "GlobalReference":
-        """ "LCIA method data set" applied to calculate the LCIA results."""
-        return get_element(self, "referenceToLCIAMethodDataSet")
+    referenceToLCIAMethodDataSets: "GlobalReference" = (
+        create_element_at_process_dataset("referenceToLCIAMethodDataSet", 0)
+    )
+    """ "LCIA method data set" applied to calculate the LCIA results."""
 
 
 class Name(etree.ElementBase):
     """General descriptive and specifying name of the process."""
 
-    baseName = create_attribute_list_process_dataset("baseName", str)
+    __slots__ = ()
+
+    baseName = create_text_list_process_dataset("baseName")
     """General descriptive name of the process and/or its main good(s) or
     service(s) and/or it's level of processing."""
 
-    treatmentStandardsRoutes = create_attribute_list_process_dataset(
-        "treatmentStandardsRoutes", str
+    treatmentStandardsRoutes = create_text_list_process_dataset(
+        "treatmentStandardsRoutes"
     )
     """Specifying information on the good, service, or process in
     technical term(s): treatment received, standard fulfilled, product quality, use
     information, production route name, educt name, primary / secondary etc. Separated
     by commata."""
 
-    mixAndLocationTypes = create_attribute_list_process_dataset(
-        "mixAndLocationTypes", str
-    )
+    mixAndLocationTypes = create_text_list_process_dataset("mixAndLocationTypes")
     """Specifying information on the good, service, or process whether
     being a production mix or consumption mix, location type of availability (such as
     e.g. "to consumer" or "at plant"). Separated by commata."""
 
-    functionalUnitFlowProperties = create_attribute_list_process_dataset(
-        "functionalUnitFlowProperties", str
+    functionalUnitFlowProperties = create_text_list_process_dataset(
+        "functionalUnitFlowProperties"
     )
     """Further, quantitative specifying information on the good, service
     or process in technical term(s): qualifying constituent(s)-content and / or
@@ -953,10 +1039,12 @@ class ComplementingProcesses(etree.ElementBase):
     identifying name of this sub-set should be stated in the field "Identifier of
     sub-data set"."""
 
-    @property
-    def referenceToComplementingProcesses(self) -> List["GlobalReference"]:
-        """Reference to one complementing process"""
-        return get_element_list(self, "referenceToComplementingProcess")
+    __slots__ = ()
+
+    referenceToComplementingProcesses: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToComplementingProcess")
+    )
+    """Reference to one complementing process"""
 
 
 class LocationOfOperationSupplyOrProduction(etree.ElementBase):
@@ -971,8 +1059,10 @@ class LocationOfOperationSupplyOrProduction(etree.ElementBase):
     consumption / supply has to be stated in the name-field "Mix and location types"
     e.g. as "Production mix".]"""
 
-    descriptionOfRestrictions = create_attribute_list_process_dataset(
-        "descriptionOfRestrictions", str
+    __slots__ = ()
+
+    descriptionOfRestrictions = create_text_list_process_dataset(
+        "descriptionOfRestrictions"
     )
     """Further explanations about additional aspects of the location: e.g.
     a company and/or site description and address, whether for certain sub-areas
@@ -991,11 +1081,19 @@ class LocationOfOperationSupplyOrProduction(etree.ElementBase):
     The fact whether the entry refers to production or to consumption / supply has to be
     stated in the name-field "Mix and location types" e.g. as "Production mix".]"""
 
-    latitudeAndLongitude = create_attribute_process_dataset("latitudeAndLongitude", str)
+    latitudeAndLongitude = create_attribute_process_dataset(
+        "latitudeAndLongitude", str, validate_latitude_and_longitude
+    )
     """Geographical latitude and longitude reference of "Location" /
     "Sub-location". For area-type locations (e.g. countries, continents) the field is
     empty."""
 
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        """Latitude and longitude of latitudeAndLongitude as floats, or None for
+        area-type locations."""
+        return parse_latitude_and_longitude(self.latitudeAndLongitude)
+
 
 class SubLocationOfOperationSupplyOrProduction(etree.ElementBase):
     """One or more geographical sub-unit(s) of the stated "Location". Such
@@ -1004,8 +1102,10 @@ class SubLocationOfOperationSupplyOrProduction(etree.ElementBase):
     data set. [Note: For single site data sets this field is empty and the site is
     named in the "Location" field.]"""
 
-    descriptionOfRestrictions = create_attribute_list_process_dataset(
-        "descriptionOfRestrictions", str
+    __slots__ = ()
+
+    descriptionOfRestrictions = create_text_list_process_dataset(
+        "descriptionOfRestrictions"
     )
     """Further explanations about additional aspects of the location: e.g.
     a company and/or site description and address, whether for certain sub-areas
@@ -1020,16 +1120,26 @@ class SubLocationOfOperationSupplyOrProduction(etree.ElementBase):
     data set. [Note: For single site data sets this field is empty and the site
     is named in the "Location" field.]"""
 
-    latitudeAndLongitude = create_attribute_process_dataset("latitudeAndLongitude", str)
+    latitudeAndLongitude = create_attribute_process_dataset(
+        "latitudeAndLongitude", str, validate_latitude_and_longitude
+    )
     """Geographical latitude and longitude reference of "Location" /
     "Sub-location". For area-type locations (e.g. countries, continents) the field is
     empty."""
 
+    @property
+    def coordinates(self) -> Optional[Tuple[float, float]]:
+        """Latitude and longitude of latitudeAndLongitude as floats, or None for
+        area-type locations."""
+        return parse_latitude_and_longitude(self.latitudeAndLongitude)
+
 
 class VariableParameter(etree.ElementBase):
     """Name of variable or parameter used as scaling factors for the "Mean
     amount" of individual inputs or outputs of the data set."""
 
+    __slots__ = ()
+
     formula = create_element_text_process_dataset("formula", str)
     """Mathematical expression that determines the value of a variable.
     [Note: A parameter is defined by entering the value manually into the field "Mean
@@ -1067,7 +1177,7 @@ class VariableParameter(etree.ElementBase):
     value (= Minimum value). This data field remains empty when uniform or triangular
     uncertainty distribution is applied.]"""
 
-    comment = create_attribute_list_process_dataset("comment", str)
+    comment = create_text_list_process_dataset("comment")
     """Comment or description of variable or parameter. Typically
     including its unit and default values, e.g. in the pattern &lt;[unit] description;
     defaults; comments&gt;."""
@@ -1089,6 +1199,8 @@ class CompletenessElementaryFlows(etree.ElementBase):
     applicability of existing LCIA methods, check the field "Supported LCIA method
     data sets".]"""
 
+    __slots__ = ()
+
     type = create_attribute_process_dataset("type", str)
     """Impact category for which the completeness information is stated."""
 
@@ -1142,17 +1254,19 @@ class Allocations(etree.ElementBase):
     """Container tag for the specification of allocations if process has
     more than one reference product. Use only for multifunctional processes."""
 
-    @property
-    def allocations(self) -> List["Allocation"]:
-        """Specifies one allocation of this exchange (see the attributes of
-        this tag below)"""
-        return get_element_list(self, "allocation")
+    __slots__ = ()
+
+    allocations: List["Allocation"] = create_element_list_process_dataset("allocation")
+    """Specifies one allocation of this exchange (see the attributes of
+    this tag below)"""
 
 
 class Allocation(etree.ElementBase):
     """Specifies one allocation of this exchange (see the attributes of
     this tag below)"""
 
+    __slots__ = ()
+
     internalReferenceToCoProduct = create_attribute_process_dataset(
         "internalReferenceToCoProduct", int
     )
@@ -1174,9 +1288,11 @@ class ReferencesToDataSource(etree.ElementBase):
     specific Input or Output, especially if differing from the general data source
     used for this data set."""
 
-    @property
-    def referenceToDataSources(self) -> List["GlobalReference"]:
-        """ ""Source data set" of data source(s) used for the value of this
-        specific Input or Output, especially if differing from the general data source
-        used for this data set."""
-        return get_element_list(self, "referenceToDataSource")
+    __slots__ = ()
+
+    referenceToDataSources: List["GlobalReference"] = (
+        create_element_list_process_dataset("referenceToDataSource")
+    )
+    """ ""Source data set" of data source(s) used for the value of this
+    specific Input or Output, especially if differing from the general data source
+    used for this data set."""
@@ -3,7 +3,6 @@
 from typing import List
 
 from lxml import etree
-from lxmlh import get_element, get_element_list
 
 from .common import (
     ClassificationInformation,
@@ -15,7 +14,9 @@ from .common import (
 from .helpers import (
     create_attribute_list_unit_group_dataset,
     create_attribute_unit_group_dataset,
+    create_element_list_unit_group_dataset,
     create_element_text_unit_group_dataset,
+    create_element_unit_group_dataset,
 )
 
 
@@ -25,49 +26,47 @@ class UnitGroupDataSet(etree.ElementBase):
     version = create_attribute_unit_group_dataset("version", str)
     """Indicates, which version of the ILCD format is used."""
 
-    @property
-    def unitGroupInformation(self) -> "UnitGroupInformation":
-        """Unit group information."""
-        return get_element(self, "unitGroupInformation")
-
-    @property
-    def modellingAndValidation(self) -> "ModellingAndValidation":
-        """Sections used to a very limited degree; covers the five sub-sections
-        1) LCI method and allocation (not used for unit groups), 2) Data sources,
-        treatment and representativeness (not used for unit groups), 3) Completeness
-        (not used for unit groups), 4) Validation (not used for unit groups), and 5)
-        Compliance."""
-        return get_element(self, "modellingAndValidation")
-
-    @property
-    def administrativeInformation(self) -> "AdministrativeInformation":
-        """Information on data set management and administration."""
-        return get_element(self, "administrativeInformation")
-
-    @property
-    def units(self) -> "Units":
-        """List of units that belong to this Unit group and are interconvertible
-        among each other with a fixed factor, such as this can be done e.g. for
-        kg, g, ounces, pounds etc. of the Unit group "Units of mass"."""
-        return get_element(self, "units")
+    unitGroupInformation: "UnitGroupInformation" = create_element_unit_group_dataset(
+        "unitGroupInformation"
+    )
+    """Unit group information."""
+
+    modellingAndValidation: "ModellingAndValidation" = (
+        create_element_unit_group_dataset("modellingAndValidation")
+    )
+    """Sections used to a very limited degree; covers the five sub-sections
+    1) LCI method and allocation (not used for unit groups), 2) Data sources,
+    treatment and representativeness (not used for unit groups), 3) Completeness
+    (not used for unit groups), 4) Validation (not used for unit groups), and 5)
+    Compliance."""
+
+    administrativeInformation: "AdministrativeInformation" = (
+        create_element_unit_group_dataset("administrativeInformation")
+    )
+    """Information on data set management and administration."""
+
+    units: "Units" = create_element_unit_group_dataset("units")
+    """List of units that belong to this Unit group and are interconvertible
+    among each other with a fixed factor, such as this can be done e.g. for
+    kg, g, ounces, pounds etc. of the Unit group "Units of mass"."""
 
 
 class UnitGroupInformation(etree.ElementBase):
     """Unit group information."""
 
-    @property
-    def dataSetInformation(self) -> "DataSetInformation":
-        """General data set information."""
-        return get_element(self, "dataSetInformation")
+    dataSetInformation: "DataSetInformation" = create_element_unit_group_dataset(
+        "dataSetInformation"
+    )
+    """General data set information."""
 
-    @property
-    def quantitativeReference(self) -> "QuantitativeReference":
-        """This section identifies the quantitative reference of this
-        data set, i.e. the "reference unit" in which the data set is
-        expressed. It is the basis for the conversion to other units
-        in the data set (e.g. for mass-related units "kg" as basis for
-        conversion to and among "g", "ounces", "short tons", etc.)."""
-        return get_element(self, "quantitativeReference")
+    quantitativeReference: "QuantitativeReference" = create_element_unit_group_dataset(
+        "quantitativeReference"
+    )
+    """This section identifies the quantitative reference of this
+    data set, i.e. the "reference unit" in which the data set is
+    expressed. It is the basis for the conversion to other units
+    in the data set (e.g. for mass-related units "kg" as basis for
+    conversion to and among "g", "ounces", "short tons", etc.)."""
 
 
 class ModellingAndValidation(etree.ElementBase):
@@ -77,45 +76,41 @@ class ModellingAndValidation(etree.ElementBase):
     (not used for unit groups), 4) Validation (not used for unit groups), and 5)
     Compliance."""
 
-    @property
-    def complianceDeclarations(self) -> "ComplianceDeclarations":
-        """Statements on compliance of several data set aspects with compliance
-        requirements as defined by the referenced compliance system (e.g. an EPD
-        scheme, handbook of a national or international data network such as the
-        ILCD, etc.)."""
-        return get_element(self, "complianceDeclarations")
+    complianceDeclarations: "ComplianceDeclarations" = (
+        create_element_unit_group_dataset("complianceDeclarations")
+    )
+    """Statements on compliance of several data set aspects with compliance
+    requirements as defined by the referenced compliance system (e.g. an EPD
+    scheme, handbook of a national or international data network such as the
+    ILCD, etc.)."""
 
 
 class AdministrativeInformation(etree.ElementBase):
     """Information on data set management and administration."""
 
-    @property
-    def dataEntryBy(self) -> "DataEntryBy":
-        """Staff or entity, that documented the generated data set,
-        entering the information into the database; plus administrative
-        information linked to the data entry activity."""
-        return get_element(self, "dataEntryBy")
+    dataEntryBy: "DataEntryBy" = create_element_unit_group_dataset("dataEntryBy")
+    """Staff or entity, that documented the generated data set,
+    entering the information into the database; plus administrative
+    information linked to the data entry activity."""
 
-    @property
-    def publicationAndOwnership(self) -> "PublicationAndOwnership":
-        """Information related to publication and version management of
-        the data set including copyright and access restrictions."""
-        return get_element(self, "publicationAndOwnership")
+    publicationAndOwnership: "PublicationAndOwnership" = (
+        create_element_unit_group_dataset("publicationAndOwnership")
+    )
+    """Information related to publication and version management of
+    the data set including copyright and access restrictions."""
 
 
 class Units(etree.ElementBase):
     """Unit group information."""
 
-    @property
-    def units(self) -> List["Unit"]:
-        """One unit."""
-        return get_element_list(self, "unit")
+    units: List["Unit"] = create_element_list_unit_group_dataset("unit")
+    """One unit."""
 
 
 class DataSetInformation(etree.ElementBase):
     """General data set information."""
 
-    commonUUID = create_attribute_unit_group_dataset("common:UUID", str)
+    commonUUID = create_element_text_unit_group_dataset("common:UUID", str)
     """Automatically generated Universally Unique Identifier of this data
     set. Together with the "Data set version", the UUID uniquely identifies each data
     set."""
@@ -137,13 +132,13 @@ class DataSetInformation(etree.ElementBase):
     a specific technology or industry-context, information sources used, data
     selection principles etc."""
 
-    @property
-    def classificationInformation(self) -> "ClassificationInformation":
-        """Hierarchical classification of the good, service, or process.
-        (Note: This entry is NOT required for the identification of a Process. It should
-        nevertheless be avoided to use identical names for Processes in the same
-        category."""
-        return get_element(self, "classificationInformation")
+    classificationInformation: "ClassificationInformation" = (
+        create_element_unit_group_dataset("classificationInformation")
+    )
+    """Hierarchical classification of the good, service, or process.
+    (Note: This entry is NOT required for the identification of a Process. It should
+    nevertheless be avoided to use identical names for Processes in the same
+    category."""
 
 
 class QuantitativeReference(etree.ElementBase):
@@ -153,6 +148,8 @@ class QuantitativeReference(etree.ElementBase):
     in the data set (e.g. for mass-related units "kg" as basis for
     conversion to and among "g", "ounces", "short tons", etc.)."""
 
+    __slots__ = ()
+
     referenceToReferenceUnit = create_attribute_unit_group_dataset(
         "referenceToReferenceUnit", int
     )
@@ -170,17 +167,19 @@ class PublicationAndOwnership(PublicationAndOwnershipGroup1):
     """Information related to publication and version management of
     the data set including copyright and access restrictions."""
 
-    @property
-    def referenceToOwnershipOfDataSet(self) -> "GlobalReference":
-        """ "Contact data set" of the person or entity who owns this
-        ata set. (Note: this is not necessarily the publisher of the
-        ata set.)"""
-        return get_element(self, "common:referenceToOwnershipOfDataSet")
+    referenceToOwnershipOfDataSet: "GlobalReference" = (
+        create_element_unit_group_dataset("common:referenceToOwnershipOfDataSet")
+    )
+    """ "Contact data set" of the person or entity who owns this
+    ata set. (Note: this is not necessarily the publisher of the
+    ata set.)"""
 
 
 class Unit(etree.ElementBase):
     """One unit."""
 
+    __slots__ = ()
+
     dataSetInternalID = create_attribute_unit_group_dataset("dataSetInternalID", int)
     """Automated entry: internal ID, used in the "Quantitative reference"
     section to identify the reference unit."""
@@ -0,0 +1,24 @@
+"""Validators for ILCD attribute values, applied before setting them."""
+
+import re
+from typing import Tuple, Union
+
+LATITUDE_AND_LONGITUDE_RE = re.compile(
+    r"\s*([\-+]?(([0-8]?\d)(\.\d*)?)|(90(\.0{0,2})?))\s*;\s*(([\-+]?(((1[0-7]\d)"
+    r"(\.\d*)?)|([0-9]\d(\.\d*)?)|(\d(\.\d*)?)|(180(\.[0]*)?))))\s*"
+)
+"""Pattern of the ILCD common GIS type, compiled once at import."""
+
+
+def validate_latitude_and_longitude(value: Union[str, Tuple[float, float]]) -> str:
+    """Validates an ILCD GIS "latitude;longitude" value before it is set.
+    Parameters:
+    value: the str value or a (latitude, longitude) tuple of floats.
+    Returns the value as str. Raises ValueError if it isn't a valid latitude and
+    longitude according to the ILCD common GIS type.
+    """
+    if isinstance(value, tuple):
+        value = f"{value[0]};{value[1]}"
+    if LATITUDE_AND_LONGITUDE_RE.fullmatch(value) is None:
+        raise ValueError(f"Invalid latitude and longitude: {value}")
+    return value
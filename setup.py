@@ -0,0 +1,24 @@
+"""Optional compiled build of the pyilcd accessor modules.
+
+All metadata lives in pyproject.toml. Setting ``PYILCD_CYTHONIZE=1`` on CPython with
+Cython installed (e.g. ``pip install --no-build-isolation .``) compiles the hot
+accessor modules to C extensions; any other build stays pure Python."""
+
+import os
+import platform
+
+from setuptools import setup
+
+extModules = []
+if (
+    os.environ.get("PYILCD_CYTHONIZE") == "1"
+    and platform.python_implementation() == "CPython"
+):
+    from Cython.Build import cythonize
+
+    extModules = cythonize(
+        ["pyilcd/process_dataset.py", "pyilcd/helpers.py"],
+        compiler_directives={"language_level": 3},
+    )
+
+setup(ext_modules=extModules)
@@ -16,3 +16,5 @@ FILE_FLOW_PROPERTY_DATASET = DIR_FLOW_PROPERTY_DATASET / "sample_flow_property.x
 FILE_PROCESS_DATASET = DIR_PROCESS_DATASET / "sample_process.xml"
 FILE_SOURCE_DATASET = DIR_SOURCE_DATASET / "sample_source.xml"
 FILE_UNIT_GROUP_DATASET = DIR_UNIT_GROUP_DATASET / "sample_unit_group.xml"
+
+WHITESPACE_TABLE = str.maketrans("", "", " \t\n")
@@ -1,5 +1,6 @@
 """Fixtures for pyilcd"""
 
+import copy
 import os
 import zipfile
 
@@ -33,73 +34,85 @@ from . import (
     FILE_PROCESS_DATASET,
     FILE_SOURCE_DATASET,
     FILE_UNIT_GROUP_DATASET,
+    WHITESPACE_TABLE,
 )
 
 
-@pytest.fixture(name="process_dataset")
+@pytest.fixture(name="process_dataset", scope="session")
 def _process_dataset() -> ProcessDataSet:
     return parse_file_process_dataset(FILE_PROCESS_DATASET)
 
 
-@pytest.fixture(name="flow_dataset")
+@pytest.fixture(name="process_dataset_fresh")
+def _process_dataset_fresh(process_dataset: ProcessDataSet) -> ProcessDataSet:
+    return copy.deepcopy(process_dataset.getroottree()).getroot()
+
+
+@pytest.fixture(name="process_dataset_text", scope="session")
+def _process_dataset_text() -> str:
+    with open(FILE_PROCESS_DATASET, encoding="utf-8") as inputFile:
+        return inputFile.read().translate(WHITESPACE_TABLE)
+
+
+@pytest.fixture(name="flow_dataset", scope="session")
 def _flow_dataset() -> FlowDataSet:
     return parse_file_flow_dataset(FILE_FLOW_DATASET)
 
 
-@pytest.fixture(name="flow_property_dataset")
+@pytest.fixture(name="flow_property_dataset", scope="session")
 def _flow_property_dataset() -> FlowPropertyDataSet:
     return parse_file_flow_property_dataset(FILE_FLOW_PROPERTY_DATASET)
 
 
-@pytest.fixture(name="unit_group_dataset")
+@pytest.fixture(name="unit_group_dataset", scope="session")
 def _unit_group_dataset() -> UnitGroupDataSet:
     return parse_file_unit_group_dataset(FILE_UNIT_GROUP_DATASET)
 
 
-@pytest.fixture(name="contact_dataset")
+@pytest.fixture(name="contact_dataset", scope="session")
 def _contact_dataset() -> ContactDataSet:
     return parse_file_contact_dataset(FILE_CONTACT_DATASET)
 
 
-@pytest.fixture(name="source_dataset")
+@pytest.fixture(name="source_dataset", scope="session")
 def _source_dataset() -> SourceDataSet:
     return parse_file_source_dataset(FILE_SOURCE_DATASET)
 
 
 def __zip_data(tmpdir, data_dir: str, file_name: str = "data.zip") -> str:
     zipFilePath = os.path.join(tmpdir, file_name)
-    with zipfile.ZipFile(zipFilePath, "w", zipfile.ZIP_DEFLATED) as zipFile:
-        for root, _, files in os.walk(data_dir):
-            for file in files:
-                zipFile.write(os.path.join(root, file), file)
+    with zipfile.ZipFile(zipFilePath, "w", zipfile.ZIP_STORED) as zipFile:
+        for entry in os.scandir(data_dir):
+            if entry.is_file(follow_symlinks=False):
+                zipFile.write(entry.path, entry.name)
     return zipFilePath
 
 
-@pytest.fixture(name="process_dataset_zip")
-def _process_dataset_zip(tmpdir) -> ProcessDataSet:
-    return __zip_data(tmpdir, DIR_PROCESS_DATASET)
+@pytest.fixture(name="process_dataset_zip", scope="session")
+def _process_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_PROCESS_DATASET)
 
 
-@pytest.fixture(name="flow_dataset_zip")
-def _flow_dataset_zip(tmpdir) -> FlowDataSet:
-    return __zip_data(tmpdir, DIR_FLOW_DATASET)
+@pytest.fixture(name="flow_dataset_zip", scope="session")
+def _flow_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_FLOW_DATASET)
 
 
-@pytest.fixture(name="flow_property_dataset_zip")
-def _flow_property_dataset_zip(tmpdir) -> FlowPropertyDataSet:
-    return __zip_data(tmpdir, DIR_FLOW_PROPERTY_DATASET)
+@pytest.fixture(name="flow_property_dataset_zip", scope="session")
+def _flow_property_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_FLOW_PROPERTY_DATASET)
 
 
-@pytest.fixture(name="unit_group_dataset_zip")
-def _unit_group_dataset_zip(tmpdir) -> UnitGroupDataSet:
-    return __zip_data(tmpdir, DIR_UNIT_GROUP_DATASET)
+@pytest.fixture(name="unit_group_dataset_zip", scope="session")
+def _unit_group_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_UNIT_GROUP_DATASET)
 
 
-@pytest.fixture(name="contact_dataset_zip")
-def _contact_dataset_zip(tmpdir) -> ContactDataSet:
-    return __zip_data(tmpdir, DIR_CONTACT_DATASET)
+@pytest.fixture(name="contact_dataset_zip", scope="session")
+def _contact_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_CONTACT_DATASET)
 
 
-@pytest.fixture(name="source_dataset_zip")
-def _source_dataset_zip(tmpdir) -> SourceDataSet:
-    return __zip_data(tmpdir, DIR_SOURCE_DATASET)
+@pytest.fixture(name="source_dataset_zip", scope="session")
+def _source_dataset_zip(tmp_path_factory) -> str:
+    return __zip_data(tmp_path_factory.mktemp("zips"), DIR_SOURCE_DATASET)
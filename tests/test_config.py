@@ -18,10 +18,12 @@ def test_config_defaults() -> None:
     schemaProcessDataset = os.path.join(schemaDir, "ILCD_ProcessDataSet.xsd")
     classificationName = "ILCD"
 
-    with open(configFilePath, "w", encoding="utf-8") as configFile:
-        configFile.write("[parameters]\n")
-        configFile.write(f"SCHEMA_PROCESS_DATASET={schemaProcessDataset}\n")
-        configFile.write(f"[Classification]\nname={classificationName}\n")
+    Path(configFilePath).write_text(
+        "[parameters]\n"
+        f"SCHEMA_PROCESS_DATASET={schemaProcessDataset}\n"
+        f"[Classification]\nname={classificationName}\n",
+        encoding="utf-8",
+    )
 
     Defaults.config_defaults(configFilePath)
 
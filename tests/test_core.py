@@ -1,11 +1,12 @@
 """Test cases for the __core__ module."""
 
-import os
-import tempfile
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
-from typing import Callable, List, Tuple, Union
+from typing import Callable, Dict, List, Tuple, Union
 
+import pytest
 from lxml import etree
 
 from pyilcd import (
@@ -15,6 +16,7 @@ from pyilcd import (
     ProcessDataSet,
     SourceDataSet,
     UnitGroupDataSet,
+    find_duplicate_datasets,
     parse_directory_contact_dataset,
     parse_directory_flow_dataset,
     parse_directory_flow_property_dataset,
@@ -22,12 +24,20 @@ from pyilcd import (
     parse_directory_source_dataset,
     parse_directory_unit_group_dataset,
     parse_file_process_dataset,
+    parse_stream_contact_dataset,
+    parse_stream_exchanges,
+    parse_stream_flow_dataset,
+    parse_stream_flow_property_dataset,
+    parse_stream_process_dataset,
+    parse_stream_source_dataset,
+    parse_stream_unit_group_dataset,
     parse_zip_file_contact_dataset,
     parse_zip_file_flow_dataset,
     parse_zip_file_flow_property_dataset,
     parse_zip_file_process_dataset,
     parse_zip_file_source_dataset,
     parse_zip_file_unit_group_dataset,
+    resolve_global_reference,
     save_ilcd_file,
     validate_directory_contact_dataset,
     validate_directory_flow_dataset,
@@ -48,14 +58,17 @@ from pyilcd import (
     validate_zip_file_source_dataset,
     validate_zip_file_unit_group_dataset,
 )
+from pyilcd.process_dataset import ProcessInformation
 
 from . import (
+    DIR_DATA,
     FILE_CONTACT_DATASET,
     FILE_FLOW_DATASET,
     FILE_FLOW_PROPERTY_DATASET,
     FILE_PROCESS_DATASET,
     FILE_SOURCE_DATASET,
     FILE_UNIT_GROUP_DATASET,
+    WHITESPACE_TABLE,
 )
 
 
@@ -132,35 +145,28 @@ def test_validate_file_source_dataset_fail() -> None:
     _validate_file_fail(validate_file_source_dataset)
 
 
-def test_save_ilcd_file() -> None:
+def test_save_ilcd_file(
+    process_dataset: ProcessDataSet, process_dataset_text: str, tmp_path: Path
+) -> None:
     """It saves read file correctly."""
-    inputPath = "data/process/sample_process.xml"
-    processDataset = parse_file_process_dataset(inputPath)
-    outputPath = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
-    save_ilcd_file(processDataset, outputPath, fill_defaults=False)
+    outputPath = str(tmp_path / "output.xml")
+    save_ilcd_file(process_dataset, outputPath, fill_defaults=False)
 
-    with open(inputPath, encoding="utf-8") as inputFile:
-        with open(outputPath, encoding="utf-8") as outputFile:
-            mapping = {ord(c): "" for c in [" ", "\t", "\n"]}
-            translatedOutput = outputFile.read().translate(mapping)
-            translatedInput = inputFile.read().translate(mapping)
-            assert translatedOutput == translatedInput
+    with open(outputPath, encoding="utf-8") as outputFile:
+        translatedOutput = outputFile.read().translate(WHITESPACE_TABLE)
+        assert translatedOutput == process_dataset_text
 
 
-def test_save_file_defaults() -> None:
+def test_save_file_defaults(
+    process_dataset_fresh: ProcessDataSet, process_dataset_text: str, tmp_path: Path
+) -> None:
     """It saves read file correctly."""
-    inputPath = FILE_PROCESS_DATASET
-    expectedOutputPath = FILE_PROCESS_DATASET
-    processDataset = parse_file_process_dataset(inputPath)
-    outputPath = os.path.join(tempfile.gettempdir(), os.urandom(24).hex())
-    save_ilcd_file(processDataset, outputPath, fill_defaults=True)
+    outputPath = str(tmp_path / "output.xml")
+    save_ilcd_file(process_dataset_fresh, outputPath, fill_defaults=True)
 
-    with open(expectedOutputPath, encoding="utf-8") as inputFile:
-        with open(outputPath, encoding="utf-8") as outputFile:
-            mapping = {ord(c): "" for c in [" ", "\t", "\n"]}
-            translatedOutput = outputFile.read().translate(mapping)
-            translatedInput = inputFile.read().translate(mapping)
-            assert translatedOutput == translatedInput
+    with open(outputPath, encoding="utf-8") as outputFile:
+        translatedOutput = outputFile.read().translate(WHITESPACE_TABLE)
+        assert translatedOutput == process_dataset_text
 
 
 def _parse_directory(
@@ -170,12 +176,12 @@ def _parse_directory(
     ],
 ) -> None:
     """It reads all files successfully."""
-    dirPath = os.path.join(Path(__file__).parents[1], "data", dataset_name)
-    files = [os.path.join(dirPath, f"sample_{dataset_name}.xml")]
+    dirPath = DIR_DATA / dataset_name
+    files = [dirPath / f"sample_{dataset_name}.xml"]
     result = parser(dirPath)
 
     assert len(result) == len(files)
-    assert result[0][0] == Path(files[0])
+    assert result[0][0] == files[0]
 
 
 def test_parse_directory_process_dataset() -> None:
@@ -215,12 +221,12 @@ def _validate_directory(
     ],
 ) -> None:
     """It reads all files successfully."""
-    dirPath = os.path.join(Path(__file__).parents[1], "data", dataset_name)
-    files = [os.path.join(dirPath, f"sample_{dataset_name}.xml")]
+    dirPath = DIR_DATA / dataset_name
+    files = [dirPath / f"sample_{dataset_name}.xml"]
     result = validator(dirPath)
 
     assert len(result) == len(files)
-    assert result[0][0] == Path(files[0])
+    assert result[0][0] == files[0]
     assert result[0][1] is None
 
 
@@ -334,3 +340,140 @@ def test_parse_zip_file_contact_dataset(contact_dataset_zip) -> None:
 def test_parse_zip_file_source_dataset(source_dataset_zip) -> None:
     """It reads zip file successfully."""
     _parse_zip_file(source_dataset_zip, parse_zip_file_source_dataset, SourceDataSet)
+
+
+def test_parse_file_without_validation() -> None:
+    """It skips schema validation on request."""
+    xml = (
+        '<processDataSet xmlns="http://lca.jrc.it/ILCD/Process" version="1.1">'
+        "<processInformation/></processDataSet>"
+    )
+
+    with pytest.raises(etree.XMLSyntaxError):
+        parse_file_process_dataset(StringIO(xml))
+
+    processDataset = parse_file_process_dataset(StringIO(xml), validate=False)
+    assert isinstance(processDataset, ProcessDataSet)
+    assert isinstance(processDataset.processInformation, ProcessInformation)
+
+
+def test_parse_file_in_threads() -> None:
+    """It parses files from several threads at once."""
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        processDatasets = list(
+            executor.map(parse_file_process_dataset, [FILE_PROCESS_DATASET] * 8)
+        )
+
+    for processDataset in processDatasets:
+        assert isinstance(processDataset.processInformation, ProcessInformation)
+
+
+def test_find_duplicate_datasets() -> None:
+    """It finds datasets sharing the same UUID and version."""
+    processDatasets = parse_directory_process_dataset(DIR_DATA / "process")
+    flowDatasets = parse_directory_flow_dataset(DIR_DATA / "flow")
+    xml = '<processDataSet xmlns="http://lca.jrc.it/ILCD/Process" version="1.1"/>'
+    datasetsWithoutUUID = [
+        (
+            Path(f"{index}.xml"),
+            parse_file_process_dataset(StringIO(xml), validate=False),
+        )
+        for index in range(2)
+    ]
+
+    assert not find_duplicate_datasets(processDatasets)
+    assert not find_duplicate_datasets(datasetsWithoutUUID)
+
+    duplicates = find_duplicate_datasets(processDatasets + flowDatasets)
+    assert duplicates == {
+        ("00000000-0000-0000-0000-000000000000", "00.00"): [
+            processDatasets[0][0],
+            flowDatasets[0][0],
+        ]
+    }
+
+
+@pytest.mark.parametrize(
+    "parse_stream, file_path, dataset_class",
+    [
+        (parse_stream_process_dataset, FILE_PROCESS_DATASET, ProcessDataSet),
+        (parse_stream_flow_dataset, FILE_FLOW_DATASET, FlowDataSet),
+        (
+            parse_stream_flow_property_dataset,
+            FILE_FLOW_PROPERTY_DATASET,
+            FlowPropertyDataSet,
+        ),
+        (parse_stream_unit_group_dataset, FILE_UNIT_GROUP_DATASET, UnitGroupDataSet),
+        (parse_stream_contact_dataset, FILE_CONTACT_DATASET, ContactDataSet),
+        (parse_stream_source_dataset, FILE_SOURCE_DATASET, SourceDataSet),
+    ],
+)
+def test_parse_stream(
+    parse_stream: Callable, file_path: Path, dataset_class: type
+) -> None:
+    """It streams files one dataset at a time and keeps the datasets intact."""
+    versions = [
+        (isinstance(dataset, dataset_class), dataset.version)
+        for dataset in parse_stream([file_path, str(file_path)])
+    ]
+
+    assert versions == [(True, "1.1"), (True, "1.1")]
+
+    datasets = list(parse_stream([file_path, str(file_path)]))
+    assert [(dataset.version, len(dataset) > 0) for dataset in datasets] == [
+        ("1.1", True),
+        ("1.1", True),
+    ]
+
+
+def test_parse_stream_exchanges(process_dataset: ProcessDataSet) -> None:
+    """It streams the same exchanges as the parsed tree."""
+    internalIds = [
+        exchange.dataSetInternalID
+        for exchange in parse_stream_exchanges(FILE_PROCESS_DATASET)
+    ]
+
+    assert internalIds == [
+        exchange.dataSetInternalID
+        for exchange in process_dataset.exchanges.iter_exchanges()
+    ]
+    assert len(internalIds) == len(process_dataset.exchanges.exchanges)
+
+
+def test_resolve_global_reference(tmp_path: Path) -> None:
+    """It resolves references relative to the dataset file, once per file with a
+    cache."""
+    (tmp_path / "processes").mkdir()
+    (tmp_path / "sources").mkdir()
+    shutil.copy(FILE_PROCESS_DATASET, tmp_path / "processes")
+    shutil.copy(
+        FILE_SOURCE_DATASET,
+        tmp_path
+        / "sources"
+        / "ILCD_Compliance_88d4f8d9-60f9-43d1-9ea3-329c10d7d727.xml",
+    )
+    processDataset = parse_file_process_dataset(
+        tmp_path / "processes" / FILE_PROCESS_DATASET.name
+    )
+    compliance = (
+        processDataset.modellingAndValidation.complianceDeclarations.compliances[0]
+    )
+    dataEntryBy = processDataset.administrativeInformation.dataEntryBy
+
+    cache: Dict[Path, etree.ElementBase] = {}
+    sourceDataset = resolve_global_reference(
+        compliance.referenceToComplianceSystem, cache
+    )
+
+    assert isinstance(sourceDataset, SourceDataSet)
+    assert sourceDataset is resolve_global_reference(
+        parse_file_process_dataset(tmp_path / "processes" / FILE_PROCESS_DATASET.name)
+        .modellingAndValidation.complianceDeclarations.compliances[0]
+        .referenceToComplianceSystem,
+        cache,
+    )
+    assert isinstance(
+        resolve_global_reference(compliance.referenceToComplianceSystem),
+        SourceDataSet,
+    )
+    assert resolve_global_reference(dataEntryBy.referenceToDataSetFormat[0]) is None
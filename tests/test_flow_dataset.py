@@ -1,6 +1,6 @@
 """Test cases for the __flow_dataset__ module."""
 
-from pyilcd.common import GlobalReference
+from pyilcd.common import Compliance, GlobalReference
 from pyilcd.flow_dataset import (
     ComplianceDeclarations,
     DataEntryBy,
@@ -21,6 +21,7 @@ def test_flow_information(flow_dataset: FlowDataSet) -> None:
     technology = flowInformation.technology
     geography = flowInformation.geography
 
+    assert datasetInformation.commonUUID == "00000000-0000-0000-0000-000000000000"
     assert isinstance(datasetInformation.name, Name)
     assert isinstance(
         datasetInformation.classificationInformation, FlowCategoryInformation
@@ -38,6 +39,9 @@ def test_modelling_and_validation(flow_dataset: FlowDataSet) -> None:
     assert isinstance(
         modellingAndValidation.complianceDeclarations, ComplianceDeclarations
     )
+    assert isinstance(
+        modellingAndValidation.complianceDeclarations.compliances[0], Compliance
+    )
 
 
 def test_administrative_information(flow_dataset: FlowDataSet) -> None:
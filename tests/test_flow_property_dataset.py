@@ -1,6 +1,6 @@
 """Test cases for the __flow_property_dataset__ module."""
 
-from pyilcd.common import ClassificationInformation, GlobalReference
+from pyilcd.common import ClassificationInformation, Compliance, GlobalReference
 from pyilcd.flow_property_dataset import (
     ComplianceDeclarations,
     DataEntryBy,
@@ -34,6 +34,9 @@ def test_modelling_and_validation(flow_property_dataset: FlowPropertyDataSet) ->
     assert isinstance(
         modellingAndValidation.complianceDeclarations, ComplianceDeclarations
     )
+    assert isinstance(
+        modellingAndValidation.complianceDeclarations.compliances[0], Compliance
+    )
     assert isinstance(
         dataSourcesTreatmentAndRepresentativeness.referenceToDataSources[0],
         GlobalReference,
@@ -1,5 +1,7 @@
 """Test cases for the __process_dataset__ module."""
 
+from lxml import etree
+
 from pyilcd.common import ClassificationInformation, GlobalReference
 from pyilcd.process_dataset import (
     Allocation,
@@ -27,6 +29,8 @@ def test_process_information(process_dataset: ProcessDataSet) -> None:
         processInformation.quantitativeReference,
         QuantitativeReference,
     )
+    assert processInformation.quantitativeReference.referenceToReferenceFlow == [0, 1]
+    assert process_dataset.metaDataOnly is False
     assert isinstance(processInformation.time, Time)
     assert isinstance(
         geography.locationOfOperationSupplyOrProduction,
@@ -36,6 +40,7 @@ def test_process_information(process_dataset: ProcessDataSet) -> None:
         geography.subLocationOfOperationSupplyOrProduction[0],
         SubLocationOfOperationSupplyOrProduction,
     )
+    assert geography.locationOfOperationSupplyOrProduction.coordinates == (0.0, 100.0)
     assert isinstance(technology.referenceToIncludedProcesses[0], GlobalReference)
     assert isinstance(technology.referenceToTechnologyPictogramme, GlobalReference)
     assert isinstance(
@@ -65,6 +70,10 @@ def test_modelling_and_validation(process_dataset: ProcessDataSet) -> None:
         dataSourcesTreatmentAndRepresentativeness.referenceToDataSource[0],
         GlobalReference,
     )
+    assert dataSourcesTreatmentAndRepresentativeness.samplingProcedure == [
+        "samplingProcedure0",
+        "samplingProcedure1",
+    ]
     assert isinstance(
         modellingAndValidation.completeness.completenessElementaryFlows[0],
         CompletenessElementaryFlows,
@@ -110,6 +119,9 @@ def test_lcia_result(process_dataset: ProcessDataSet) -> None:
     lciaResult = process_dataset.lciaResults.lciaResults[0]
 
     assert isinstance(lciaResult.referenceToLCIAMethodDataSets, GlobalReference)
+    assert list(process_dataset.lciaResults.iter_lcia_results()) == (
+        process_dataset.lciaResults.lciaResults
+    )
 
 
 def test_dataset_information(process_dataset: ProcessDataSet) -> None:
@@ -140,3 +152,120 @@ def test_exchange(process_dataset: ProcessDataSet) -> None:
         exchange.referencesToDataSource.referenceToDataSources[0], GlobalReference
     )
     assert isinstance(exchange.referenceToFlowDataSet, GlobalReference)
+
+
+def test_exchange_reference_out_of_position(
+    process_dataset_fresh: ProcessDataSet,
+) -> None:
+    """It finds fixed position elements that aren't at their position."""
+    exchange = process_dataset_fresh.exchanges.exchanges[0]
+    referenceToFlowDataSet = exchange.referenceToFlowDataSet
+    exchange.insert(0, etree.Comment("moved"))
+
+    assert exchange.referenceToFlowDataSet is referenceToFlowDataSet
+
+
+def test_read_amounts(process_dataset: ProcessDataSet) -> None:
+    """It reads the same amounts as the exchange properties."""
+    exchanges = process_dataset.exchanges
+    amounts = exchanges.read_amounts()
+
+    for name, column in amounts.items():
+        assert column == [getattr(exchange, name) for exchange in exchanges.exchanges]
+
+
+def test_read_variables(process_dataset: ProcessDataSet) -> None:
+    """It reads the mean values of the variables by name."""
+    mathematicalRelations = process_dataset.processInformation.mathematicalRelations
+    variables = mathematicalRelations.read_variables()
+
+    assert variables == {
+        variable.name: variable.meanValue
+        for variable in mathematicalRelations.variableParameter
+    }
+    for exchange in process_dataset.exchanges.exchanges:
+        assert exchange.referenceToVariable in variables
+
+
+def test_as_tuple(process_dataset: ProcessDataSet) -> None:
+    """It reads the same fields as the properties in one walk."""
+    processInformation = process_dataset.processInformation
+    for element in [processInformation.dataSetInformation, processInformation.time]:
+        fields = element.as_tuple()
+
+        assert fields == tuple(getattr(element, field) for field in fields._fields)
+    assert processInformation.dataSetInformation.as_tuple().commonUUID == (
+        "00000000-0000-0000-0000-000000000000"
+    )
+
+
+def test_to_dict(process_dataset: ProcessDataSet) -> None:
+    """It reads the whole dataset into nested dicts."""
+    dataset = process_dataset.to_dict()
+    dataSetInformation = dataset["processInformation"]["dataSetInformation"]
+
+    assert dataset["version"] == process_dataset.version
+    assert dataSetInformation["UUID"] == "00000000-0000-0000-0000-000000000000"
+    assert dataSetInformation["synonyms"] == [
+        {"lang": "en", "text": "synonyms0"},
+        {"lang": "de", "text": "synonyms1"},
+    ]
+    assert len(dataset["exchanges"]["exchange"]) == len(
+        process_dataset.exchanges.exchanges
+    )
+
+
+def test_child_lookup_follows_edits(process_dataset_fresh: ProcessDataSet) -> None:
+    """It doesn't return children removed from or missed before edits of the tree."""
+    processInformation = process_dataset_fresh.processInformation
+    exchanges = process_dataset_fresh.exchanges
+    time = processInformation.time
+    exchange = exchanges.exchanges[0]
+
+    processInformation.remove(time)
+    exchanges.remove(exchange)
+
+    assert processInformation.time is None
+    assert exchange not in exchanges.exchanges
+
+    processInformation.append(time)
+    exchanges.append(exchange)
+
+    assert processInformation.time is time
+    assert exchanges.exchanges[-1] is exchange
+
+
+def test_child_lookup_follows_inserted_siblings(
+    process_dataset_fresh: ProcessDataSet,
+) -> None:
+    """It returns a child with the same tag inserted in front of a retrieved one."""
+    processInformation = process_dataset_fresh.processInformation
+    time = processInformation.time
+    newTime = processInformation.makeelement(time.tag)
+
+    processInformation.insert(processInformation.index(time), newTime)
+
+    assert processInformation.time is newTime
+
+
+def test_read_booleans(process_dataset_fresh: ProcessDataSet) -> None:
+    """It reads the whole xs:boolean lexical space, surrounding whitespace included."""
+    for value, expected in [
+        (" True ", True),
+        ("1", True),
+        ("false", False),
+        ("0", False),
+    ]:
+        process_dataset_fresh.set("metaDataOnly", value)
+
+        assert process_dataset_fresh.metaDataOnly is expected
+
+
+def test_set_number_list(process_dataset_fresh: ProcessDataSet) -> None:
+    """It replaces the elements in place, so that the dataset stays valid."""
+    quantitativeReference = (
+        process_dataset_fresh.processInformation.quantitativeReference
+    )
+    quantitativeReference.referenceToReferenceFlow = [1]
+
+    assert quantitativeReference.referenceToReferenceFlow == [1]
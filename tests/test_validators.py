@@ -0,0 +1,28 @@
+"""Test cases for the __validators__ module."""
+
+import pytest
+
+from pyilcd.process_dataset import ProcessDataSet
+from pyilcd.validators import validate_latitude_and_longitude
+
+
+def test_validate_latitude_and_longitude() -> None:
+    """It accepts ILCD GIS strings and pairs."""
+    assert validate_latitude_and_longitude(" 47.5 ; -8.25 ") == " 47.5 ; -8.25 "
+    assert validate_latitude_and_longitude((47.5, 8.25)) == "47.5;8.25"
+
+    for value in ["", "47.5", "47.5,8.25", "91;0", "0;181"]:
+        with pytest.raises(ValueError):
+            validate_latitude_and_longitude(value)
+
+
+def test_set_latitude_and_longitude(process_dataset_fresh: ProcessDataSet) -> None:
+    """It validates the value before setting it."""
+    geography = process_dataset_fresh.processInformation.geography
+    location = geography.locationOfOperationSupplyOrProduction
+    location.latitudeAndLongitude = (10.5, 20.0)
+
+    assert location.coordinates == (10.5, 20.0)
+    with pytest.raises(ValueError):
+        location.latitudeAndLongitude = "10.5"
+    assert location.latitudeAndLongitude == "10.5;20.0"